@@ -1,12 +1,29 @@
 import time
 import math
-from multiprocessing import Pool, cpu_count
-from config import WEIGHTS, DMAX, TIME_LIMIT
-from game import OthelloGame
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool, RawValue, cpu_count
+from config import WEIGHTS, DMAX, TIME_LIMIT, TT_SIZE, PY_TT_SIZE, MOVEGEN_CACHE_SIZE
+from game import (square_bit, bit_to_square, zobrist_hash, zobrist_update, ZOBRIST_SIDE,
+                  split_board, get_legal_moves_bb, get_mobility_bb, get_flips_bb,
+                  apply_move_bb)
+
+# Optional Numba kernel; the pure-Python search below is used without it.
+try:
+    import numpy as np
+    import search_nb
+except ImportError:
+    search_nb = None
 
 # Constants for board pieces
 EMPTY, BLACK, WHITE = 0, 1, -1
 
+# Half-width of the aspiration window around a previous depth's score
+ASPIRATION_DELTA = 2 * WEIGHTS["material"]
+
+# Transposition table entry flags
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
 # Directions (8-neighbors)
 DIRECTIONS = [
     (-1, -1), (-1, 0), (-1, 1),
@@ -15,64 +32,73 @@ DIRECTIONS = [
 ]
 
 
-def evaluate_board(board, color, game):
+# Bitboard masks used by the evaluation (bit = row * 8 + col)
+CORNERS = square_bit(0, 0) | square_bit(0, 7) | square_bit(7, 0) | square_bit(7, 7)
+EDGES = 0xFF000000000000FF | 0x8181818181818181  # rows 0/7 and columns 0/7
+X_SQUARES = square_bit(1, 1) | square_bit(1, 6) | square_bit(6, 1) | square_bit(6, 6)
+
+# Move ordering classes: corners first, X-squares (diagonal to a corner) last
+MOVE_ORDER_MASKS = (CORNERS, ~(CORNERS | X_SQUARES) & ((1 << 64) - 1), X_SQUARES)
+
+# Stability proxy: each corner paired with the mask of its on-board neighbours
+CORNER_NEIGHBORS = tuple(
+    (square_bit(ci, cj), sum(
+        square_bit(ci + di, cj + dj) for di, dj in DIRECTIONS
+        if 0 <= ci + di < 8 and 0 <= cj + dj < 8
+    ))
+    for ci, cj in [(0, 0), (0, 7), (7, 0), (7, 7)]
+)
+
+# Indexed by the 4-bit pattern of owned corners (bit k = k-th corner above):
+# the owned corners plus their neighbours, so the whole stability proxy is
+# a single popcount of own & STABILITY_MASKS[pattern]
+STABILITY_MASKS = tuple(
+    sum(corner | neighbors for k, (corner, neighbors) in enumerate(CORNER_NEIGHBORS) if pattern >> k & 1)
+    for pattern in range(16)
+)
+
+
+def corner_pattern(own):
+    #4-bit index of the corners set in own (a1, h1, a8, h8).
+    return (own & 1) | (own >> 6 & 2) | (own >> 54 & 4) | (own >> 60 & 8)
+
+
+def evaluate_board(board, color, my_moves_bb=None, opp_moves_bb=None):
     """
     Standalone evaluation function equivalent to OthelloAI.evaluate,
     but usable inside worker processes (no dependence on self).
+
+    board is a (black, white) bitboard tuple; every term is a popcount
+    over a precomputed mask. Legal-move bitboards already known to the
+    caller can be passed in to skip regenerating them for mobility.
     """
+    own, opp = split_board(board, color)
+    if my_moves_bb is None:
+        my_moves_bb = get_legal_moves_bb(board, color)
+    if opp_moves_bb is None:
+        opp_moves_bb = get_legal_moves_bb(board, -color)
+    return evaluate_leaf(own, opp, my_moves_bb, opp_moves_bb)
+
 
+def evaluate_leaf(own, opp, own_moves, opp_moves):
+    """
+    Leaf evaluation from own's point of view, given both sides' discs and
+    legal-move bitboards (the search supplies these from its move cache).
+    """
     # --- Material ---
-    black_count = sum(row.count(BLACK) for row in board)
-    white_count = sum(row.count(WHITE) for row in board)
-    material = black_count - white_count if color == BLACK else white_count - black_count
+    material = own.bit_count() - opp.bit_count()
 
     # --- Mobility ---
-    my_moves = len(game.get_legal_moves(board, color))
-    opp_moves = len(game.get_legal_moves(board, -color))
-    mobility = 0
-    if my_moves + opp_moves != 0:
-        mobility = my_moves - opp_moves
+    mobility = own_moves.bit_count() - opp_moves.bit_count()
 
     # --- Corners ---
-    corners_idx = [(0, 0), (0, 7), (7, 0), (7, 7)]
-    my_corners = sum(1 for i, j in corners_idx if board[i][j] == color)
-    opp_corners = sum(1 for i, j in corners_idx if board[i][j] == -color)
-    corners = my_corners - opp_corners
-
-    # --- Edges ---
-    my_edges = 0
-    opp_edges = 0
-
-    # Top and bottom edges
-    for i in [0, 7]:
-        for j in range(8):
-            if board[i][j] == color:
-                my_edges += 1
-            elif board[i][j] == -color:
-                opp_edges += 1
-
-    # Left and right edges (excluding corners)
-    for j in [0, 7]:
-        for i in range(1, 7):
-            if board[i][j] == color:
-                my_edges += 1
-            elif board[i][j] == -color:
-                opp_edges += 1
-
-    edges = my_edges - opp_edges
-
-    # --- Stability proxy (around owned corners) ---
-    stability = 0
-    for ci, cj in corners_idx:
-        if board[ci][cj] == color:
-            stability += 1  # corner itself
-            for di in range(-1, 2):
-                for dj in range(-1, 2):
-                    if di == 0 and dj == 0:
-                        continue
-                    ni, nj = ci + di, cj + dj
-                    if 0 <= ni < 8 and 0 <= nj < 8 and board[ni][nj] == color:
-                        stability += 1
+    corners = (own & CORNERS).bit_count() - (opp & CORNERS).bit_count()
+
+    # --- Edges (corners included, as in the row/column scan) ---
+    edges = (own & EDGES).bit_count() - (opp & EDGES).bit_count()
+
+    # --- Stability proxy (owned corners and own discs next to them) ---
+    stability = (own & STABILITY_MASKS[corner_pattern(own)]).bit_count()
 
     score = (
         WEIGHTS["material"] * material +
@@ -84,59 +110,238 @@ def evaluate_board(board, color, game):
     return score
 
 
+def _mobility(board, key, color, movegen_cache):
+    """
+    (color's, opponent's) legal-move bitboards of board, where key is its
+    Zobrist hash with color to move. Both come from movegen_cache when
+    present; when neither is they are generated together in one pass.
+    """
+    other_key = key ^ ZOBRIST_SIDE
+    moves = movegen_cache.get(key)
+    other = movegen_cache.get(other_key)
+    if moves is None and other is None:
+        moves, other = get_mobility_bb(board, color)
+        movegen_cache[key] = moves
+        movegen_cache[other_key] = other
+    elif moves is None:
+        moves = movegen_cache[key] = get_legal_moves_bb(board, color)
+    elif other is None:
+        other = movegen_cache[other_key] = get_legal_moves_bb(board, -color)
+    return moves, other
+
+
+class _Frame:
+    """One expanded node on the explicit negamax stack."""
+    __slots__ = ('board', 'key', 'depth', 'alpha', 'alpha_orig', 'beta', 'color',
+                 'moves', 'first', 'move_bit', 'best', 'best_bit')
+
+    def __init__(self, board, key, depth, alpha, beta, color, moves, first):
+        self.board = board
+        self.key = key
+        self.depth = depth
+        self.alpha = alpha
+        self.alpha_orig = alpha   # window the node was searched with,
+        self.beta = beta          # used to classify the TT entry
+        self.color = color
+        self.moves = moves        # legal moves not searched yet (bitboard)
+        self.first = first        # TT best move, searched before the rest
+        self.move_bit = 0         # move whose subtree is being searched
+        self.best = -math.inf
+        self.best_bit = 0
+
+
+def negamax_search(board, key, depth, alpha, beta, color, root_color,
+                   tt, movegen_cache, stop_requested):
+    """
+    Iterative negamax alpha-beta over an explicit stack of _Frame records
+    (no Python recursion).
+
+    Scores are from the point of view of color, the side to move, while
+    leaves are evaluated for root_color as in evaluate_board. tt maps
+    Zobrist keys to (depth, flag, value, best_bit) and movegen_cache maps
+    them to legal-move bitboards. stop_requested() is polled every 2048
+    nodes; once it returns True the search unwinds without storing. Once
+    tt holds PY_TT_SIZE entries only positions already in it are updated;
+    movegen_cache is cleared at the poll interval once it holds
+    MOVEGEN_CACHE_SIZE entries.
+
+    Returns (best_bit, value, nodes).
+    """
+    stack = []
+    nodes = 0
+    stopped = stop_requested()
+    pending = (board, key, depth, alpha, beta, color)  # node to enter next
+    ret = None  # score handed back by the node that just finished
+
+    while True:
+        if pending is not None:
+            board, key, depth, alpha, beta, color = pending
+            pending = None
+            nodes += 1
+            if not nodes & 2047:
+                stopped = stop_requested()
+                # Keep the move cache bounded during long searches
+                if len(movegen_cache) >= MOVEGEN_CACHE_SIZE:
+                    movegen_cache.clear()
+
+            if depth == 0 or stopped:
+                moves = None
+            else:
+                moves = movegen_cache.get(key)
+                if moves is None:
+                    moves = get_legal_moves_bb(board, color)
+                    movegen_cache[key] = moves
+            tt_bit = 0
+
+            # Terminal conditions: depth, no moves, or time up. Leaves
+            # evaluate for root_color from both sides' mobility.
+            if not moves:
+                moves, other = _mobility(board, key, color, movegen_cache)
+                own, opp = split_board(board, root_color)
+                if color == root_color:
+                    ret = evaluate_leaf(own, opp, moves, other)
+                else:
+                    ret = -evaluate_leaf(own, opp, other, moves)
+            else:
+                # Transposition table probe
+                entry = tt.get(key)
+                if entry is not None:
+                    tt_depth, tt_flag, tt_value, tt_bit = entry
+                    if tt_depth >= depth:
+                        if tt_flag == TT_EXACT:
+                            ret = tt_value
+                        elif tt_flag == TT_LOWER:
+                            alpha = max(alpha, tt_value)
+                        else:
+                            beta = min(beta, tt_value)
+                        if alpha >= beta:
+                            ret = tt_value
+                if ret is None:
+                    stack.append(_Frame(board, key, depth, alpha, beta, color, moves, moves & tt_bit))
+
+            if ret is not None and not stack:
+                return tt_bit, ret, nodes
+
+        frame = stack[-1]
+
+        # Fold in the score of the child that just finished
+        if ret is not None:
+            value = -ret
+            ret = None
+            if value > frame.best:
+                frame.best = value
+                frame.best_bit = frame.move_bit
+            if value > frame.alpha:
+                frame.alpha = value
+            if frame.alpha >= frame.beta:
+                frame.moves = 0
+
+        # Next child: TT move, then corners, the rest, X-squares last
+        if frame.moves and not stopped:
+            move_bit = frame.first
+            if move_bit:
+                frame.first = 0
+            else:
+                for mask in MOVE_ORDER_MASKS:
+                    if frame.moves & mask:
+                        move_bit = frame.moves & mask
+                        move_bit &= -move_bit
+                        break
+            frame.moves ^= move_bit
+            frame.move_bit = move_bit
+
+            flips = get_flips_bb(frame.board, move_bit, frame.color)
+            pending = (
+                apply_move_bb(frame.board, move_bit, frame.color, flips),
+                zobrist_update(frame.key, move_bit, flips, frame.color),
+                frame.depth - 1,
+                -frame.beta,
+                -frame.alpha,
+                -frame.color,
+            )
+            continue
+
+        # Node finished: store the result unless the clock cut it short
+        stack.pop()
+        if frame.best_bit and not stopped:
+            if frame.best <= frame.alpha_orig:
+                flag = TT_UPPER
+            elif frame.best >= frame.beta:
+                flag = TT_LOWER
+            else:
+                flag = TT_EXACT
+            if len(tt) < PY_TT_SIZE or frame.key in tt:
+                tt[frame.key] = (frame.depth, flag, frame.best, frame.best_bit)
+        if not stack:
+            return frame.best_bit, frame.best, nodes
+        ret = frame.best
+
+
+def _prune_tt(tt, size=PY_TT_SIZE):
+    """
+    Make room in a dict TT between searches by dropping the shallowest
+    entries (the cheapest to recompute) until at most size // 2 remain.
+    """
+    depth = 0
+    while len(tt) > size // 2:
+        for key in [key for key, entry in tt.items() if entry[0] <= depth]:
+            del tt[key]
+        depth += 1
+
+
 def _parallel_worker(args):
     """
     Worker function used by multiprocessing.Pool.
 
-    Each process:
-      - applies a single candidate move at the root
-      - runs alpha-beta from the resulting position
-      - returns (move, score)
+    Each task is a chunk of root moves, so the per-task fixed cost is paid
+    once per worker rather than once per move. For every move it:
+      - applies the candidate move at the root
+      - runs alpha-beta from the resulting position within (alpha, beta),
+        sharing one TT and move-generation cache across the chunk
+    and returns the list of (move, score).
 
     NOTE: This is written without depending on OthelloAI instances
-    to stay pickle-safe on Windows.
+    to stay pickle-safe on Windows. The board is a (black, white)
+    bitboard tuple, so each task pickles as two ints. The search stops
+    when the agent's timer sets the flag installed by _init_worker.
     """
-    board, move, depth, color, start_time, time_limit = args
-
-    game = OthelloGame()
-
-    def time_exceeded() -> bool:
-        return (time.time() - start_time) >= time_limit
-
-    def alphabeta(local_board, d, alpha, beta, maximizing):
-        # Determine whose turn it is in this node
-        node_color = color if maximizing else -color
-        legal_moves = game.get_legal_moves(local_board, node_color)
-
-        # Terminal conditions: depth, no moves, or time up
-        if d == 0 or not legal_moves or time_exceeded():
-            return evaluate_board(local_board, color, game)
-
-        if maximizing:
-            value = -math.inf
-            for m in legal_moves:
-                child_board = game.apply_move(local_board, m, node_color)
-                eval_val = alphabeta(child_board, d - 1, alpha, beta, False)
-                value = max(value, eval_val)
-                alpha = max(alpha, eval_val)
-                if beta <= alpha:
-                    break
-            return value
-        else:
-            value = math.inf
-            for m in legal_moves:
-                child_board = game.apply_move(local_board, m, node_color)
-                eval_val = alphabeta(child_board, d - 1, alpha, beta, True)
-                value = min(value, eval_val)
-                beta = min(beta, eval_val)
-                if beta <= alpha:
-                    break
-            return value
+    board, key, moves, depth, color, alpha, beta = args
 
-    # Apply the root move and then search from opponent's perspective
-    new_board = game.apply_move(board, move, color)
-    score = alphabeta(new_board, depth - 1, -math.inf, math.inf, False)
-    return move, score
+    tt, movegen_cache = {}, {}
+
+    def stop_requested() -> bool:
+        return _worker_stop.value != 0
+
+    results = []
+    for move in moves:
+        # Apply the root move and then search from opponent's perspective
+        new_board, new_key = _play_root_move(board, key, move, color)
+        _, score, _ = negamax_search(new_board, new_key, depth - 1, -beta, -alpha, -color, color,
+                                     tt, movegen_cache, stop_requested)
+        results.append((move, -score))
+    return results
+
+
+_worker_stop = None
+
+
+def _init_worker(stop):
+    """
+    Pool initializer: keep the shared stop flag (a RawValue can only be
+    handed to worker processes at creation, not through task args).
+    """
+    global _worker_stop
+    _worker_stop = stop
+
+
+def _play_root_move(board, key, move, color):
+    """
+    Apply a root move; returns the child board and its Zobrist key,
+    updated incrementally from the root key.
+    """
+    move_bit = square_bit(*move)
+    flips = get_flips_bb(board, move_bit, color)
+    return apply_move_bb(board, move_bit, color, flips), zobrist_update(key, move_bit, flips, color)
 
 
 class OthelloAI:
@@ -147,23 +352,102 @@ class OthelloAI:
     Compatible with the existing Tkinter GUI (gui.py).
     """
 
-    def __init__(self, game, color):
+    def __init__(self, game, color, stop_event=None):
         # Initialize the Othello AI.
         self.game = game
         self.color = color
+        # Optional threading.Event set by the caller to cancel a search
+        self.stop_event = stop_event
+        self.root_key = None  # Zobrist key of game.board with color to move, if known
         self.start_time = None
         self.best_move = None
+        self.pv_move = None  # best root move of the last completed depth
 
         # Optional: GUI looks for this; we keep it for compatibility.
         self.nodes_evaluated = 0
 
+        # Transposition table: Zobrist key -> (depth, flag, value, best_bit),
+        # capped at PY_TT_SIZE and pruned by depth between iterations.
+        # The Numba kernel uses fixed-size arrays instead of the dict.
+        self.tt = {}
+        # Legal-move bitboards keyed by Zobrist key (side to move included),
+        # shared between node expansion and leaf mobility within one get_move
+        # (cleared mid-search once it holds MOVEGEN_CACHE_SIZE entries)
+        self._movegen_cache = {}
+        self._tables = search_nb.new_tables(TT_SIZE) if search_nb is not None else None
+
+        # Node counter shared with the Numba kernel
+        self._counters = np.zeros(1, dtype=np.int64) if search_nb is not None else None
+
+        # Worker pool, created on first parallel search and reused across
+        # depths and moves until close(). With the Numba kernel (which
+        # releases the GIL) this is a thread pool sharing self._tables;
+        # otherwise a process pool running _parallel_worker.
+        self._pool = None
+        self._nodes_lock = threading.Lock()
+
+        # Stop flag raised by a timer after TIME_LIMIT: a RawValue shared
+        # with worker processes, mirrored in an int8 array for the kernel
+        self._stop = RawValue('b', 0)
+        self._stop_nb = np.zeros(1, dtype=np.int8) if search_nb is not None else None
+        self._timer = None
+        self._search_done = None
+
+    def set_state(self, game, key=None):
+        """
+        Point a reused agent at the current game. key, when given, is the
+        Zobrist hash of game.board with this agent to move (as maintained
+        incrementally by the caller); otherwise it is computed. The
+        transposition tables are kept, so later moves start warm.
+        """
+        self.game = game
+        self.root_key = key
+
+    def close(self):
+        """Shut down the worker pool (call when the game ends)."""
+        if self._pool is not None:
+            if isinstance(self._pool, ThreadPoolExecutor):
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._pool.terminate()
+                self._pool.join()
+            self._pool = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     # ------------------------------------------------------------------
     # Timing helpers
     # ------------------------------------------------------------------
     def time_exceeded(self) -> bool:
-        if self.start_time is None:
-            return False
-        return (time.time() - self.start_time) >= TIME_LIMIT
+        return self._stop.value != 0
+
+    def request_stop(self):
+        """Abort the running search; get_move returns its best-so-far move."""
+        self._stop.value = 1
+        if self._stop_nb is not None:
+            self._stop_nb[0] = 1
+
+    def _start_timer(self):
+        self._stop.value = 0
+        if self._stop_nb is not None:
+            self._stop_nb[0] = 0
+        self._timer = threading.Timer(TIME_LIMIT, self.request_stop)
+        self._timer.daemon = True
+        self._timer.start()
+        if self.stop_event is not None:
+            # Forward the caller's event to the stop flag until this
+            # search finishes; the watcher never outlives TIME_LIMIT.
+            self._search_done = threading.Event()
+            threading.Thread(target=self._watch_stop, args=(self._search_done,),
+                             daemon=True).start()
+
+    def _watch_stop(self, done):
+        if self.stop_event.wait(TIME_LIMIT) and not done.is_set():
+            self.request_stop()
 
     # ------------------------------------------------------------------
     # Public entry point
@@ -174,64 +458,116 @@ class OthelloAI:
 
         Uses:
           - Sequential alpha-beta at shallow depths or single-move cases.
-          - Parallel root search (multiprocessing) when there are multiple
-            legal moves and depth >= 2.
+          - Parallel root search (threads over the Numba kernel, processes
+            otherwise) when there are multiple legal moves and depth >= 2.
+          - Aspiration windows around the score two depths back, widened
+            and re-searched on fail-high / fail-low.
 
         Returns the best move found before the time limit.
         """
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.best_move = None
         self.nodes_evaluated = 0
+        if self._counters is not None:
+            self._counters[0] = 0
+        self._movegen_cache.clear()
 
         # Get initial legal moves from current position
-        legal_moves = self.game.get_legal_moves(self.game.board, self.color)
+        board = self.game.board
+        legal_moves = self.game.get_legal_moves(board, self.color)
         if not legal_moves:
             return None
+        # A key from set_state describes this position only; don't reuse it
+        key = self.root_key if self.root_key is not None else zobrist_hash(board, self.color)
+        self.root_key = None
 
         # Default fallback move in case we run out of time immediately
         self.best_move = legal_moves[0]
+        self.pv_move = None
+        scores = {}
 
-        # Iterative deepening loop
-        for depth in range(1, DMAX + 1):
-            if self.time_exceeded():
-                break
-
-            # If only one move, or very shallow depth, no need for parallelization
-            if len(legal_moves) == 1 or depth == 1:
-                move, _ = self._root_search_sequential(self.game.board, legal_moves, depth)
-            else:
-                move, _ = self._root_search_parallel(self.game.board, legal_moves, depth)
-
-            # If we still have time and found a move, update best_move
-            if not self.time_exceeded() and move is not None:
-                self.best_move = move
+        # One timer flips the stop flag instead of every node reading the clock
+        self._start_timer()
+        try:
+            # Iterative deepening loop
+            for depth in range(1, DMAX + 1):
+                if self.time_exceeded():
+                    break
+                if len(self.tt) >= PY_TT_SIZE:
+                    _prune_tt(self.tt)
+
+                # Search the previous iteration's best move first
+                legal_moves = self._order_root_moves(legal_moves, self.pv_move)
+
+                # Centre the window on the last score of the same depth parity:
+                # odd and even depths disagree by more than one window width.
+                prev = scores.get(depth - 2)
+                if prev is None:
+                    alpha, beta = -math.inf, math.inf
+                else:
+                    alpha, beta = prev - ASPIRATION_DELTA, prev + ASPIRATION_DELTA
+
+                while True:
+                    # If only one move, or very shallow depth, no need for parallelization
+                    if len(legal_moves) == 1 or depth == 1:
+                        move, score = self._root_search_sequential(board, legal_moves, depth, alpha, beta, key)
+                    else:
+                        move, score = self._root_search_parallel(board, legal_moves, depth, alpha, beta, key)
+
+                    if self.time_exceeded():
+                        break
+                    # Fail-low / fail-high: the true score is outside the window
+                    if score <= alpha:
+                        alpha = -math.inf
+                    elif score >= beta:
+                        beta = math.inf
+                    else:
+                        break
+
+                # If we still have time and found a move, update best_move
+                if not self.time_exceeded() and move is not None:
+                    self.best_move = move
+                    self.pv_move = move
+                    scores[depth] = score
+        finally:
+            self._timer.cancel()
+            if self._search_done is not None:
+                self._search_done.set()
 
         return self.best_move
 
     # ------------------------------------------------------------------
     # Root search helpers (sequential & parallel)
     # ------------------------------------------------------------------
-    def _root_search_sequential(self, board, moves, depth):
+    def _root_search_sequential(self, board, moves, depth, alpha=-math.inf, beta=math.inf, key=None):
         """
-        Sequential root-level search with alpha-beta pruning.
+        Sequential root-level search with alpha-beta pruning. key is the
+        Zobrist hash of board with self.color to move (computed if None).
+
+        Returns (best_move, best_score); best_score is fail-soft, i.e.
+        <= alpha or >= beta when the true score lies outside the window.
         """
+        if key is None:
+            key = zobrist_hash(board, self.color)
+        if search_nb is not None:
+            return self._root_search_kernel(board, moves, depth, alpha, beta, key)
+
         best_move = None
         best_score = -math.inf
-        alpha = -math.inf
-        beta = math.inf
         color = self.color
 
         for move in moves:
             if self.time_exceeded():
                 break
 
-            new_board = self.game.apply_move(board, move, color)
+            new_board, new_key = _play_root_move(board, key, move, color)
             _, eval_val = self.alphabeta_search(
                 new_board,
                 depth - 1,
                 alpha,
                 beta,
-                maximizing_player=False
+                maximizing_player=False,
+                key=new_key
             )
 
             if eval_val > best_score or best_move is None:
@@ -240,164 +576,174 @@ class OthelloAI:
 
             # Update alpha for future children (root-level alpha-beta)
             alpha = max(alpha, eval_val)
+            if alpha >= beta:
+                break
 
         return best_move, best_score
 
-    def _root_search_parallel(self, board, moves, depth):
+    def _root_search_kernel(self, board, moves, depth, alpha, beta, key):
+        """
+        _root_search_sequential as a single call into the Numba kernel,
+        with the root moves passed as square indices.
+        """
+        own, opp = split_board(board, self.color)
+        index, score = search_nb.root_search(
+            own, opp, key, 0 if self.color == BLACK else 1,
+            [row * 8 + col for row, col in moves], depth, alpha, beta,
+            self._tables, self._counters, self._stop_nb)
+        self.nodes_evaluated = int(self._counters[0])
+        if index < 0:
+            return None, -math.inf
+        return moves[index], score
+
+    def _root_search_parallel(self, board, moves, depth, alpha=-math.inf, beta=math.inf, key=None):
         """
-        Parallel root-level search using multiprocessing.Pool.
+        Parallel root-level search on the persistent worker pool
+        (Young Brothers Wait):
+          1. search the first (PV) move in-process to establish alpha,
+          2. scout the remaining moves in parallel with a null window
+             (alpha, alpha + 1),
+          3. re-search with (alpha, beta) only the moves that fail high.
         """
         if self.time_exceeded():
             return self.best_move, -math.inf
+        if key is None:
+            key = zobrist_hash(board, self.color)
 
-        # Build argument list for each worker
-        tasks = [
-            (board, move, depth, self.color, self.start_time, TIME_LIMIT)
-            for move in moves
-        ]
-
-        n_procs = min(cpu_count(), len(moves))
+        n_procs = min(cpu_count(), len(moves) - 1)
         if n_procs <= 1:
-            return self._root_search_sequential(board, moves, depth)
+            return self._root_search_sequential(board, moves, depth, alpha, beta, key)
+
+        # Eldest brother first, sequentially
+        best_move, best_score = self._root_search_sequential(board, moves[:1], depth, alpha, beta, key)
+        if best_score >= beta or self.time_exceeded():
+            return best_move, best_score
+        alpha = max(alpha, best_score)
+
+        def tasks(task_moves, lo, hi):
+            # One chunk per worker; striding keeps the best-ordered moves
+            # spread across chunks
+            n = min(n_procs, len(task_moves))
+            return [
+                (board, key, task_moves[i::n], depth, self.color, lo, hi)
+                for i in range(n)
+            ]
 
         try:
-            with Pool(processes=n_procs) as pool:
-                results = pool.map(_parallel_worker, tasks)
+            scout = self._pool_map(tasks(moves[1:], alpha, alpha + 1))
+            # One score per move. Scout scores are bounds: upper bounds on
+            # fail-low, lower bounds on fail-high until re-searched.
+            scores = dict(scout)
+            lower_bounds = [move for move, score in scout if score > alpha]
+
+            # Resolve the true score of every move that beat the scout bound;
+            # the re-search result replaces its scout bound
+            if lower_bounds and not self.time_exceeded():
+                scores.update(self._pool_map(tasks(lower_bounds, alpha, beta)))
         except Exception as e:
             print(f"[OthelloAI] Parallel root search failed ({e}), falling back to sequential.")
-            return self._root_search_sequential(board, moves, depth)
+            return self._root_search_sequential(board, moves, depth, alpha, beta, key)
 
-        best_move, best_score = max(results, key=lambda x: x[1])
+        # If the clock skipped the re-search, moves in lower_bounds keep
+        # their scout bound; it still beats the eldest brother
+        for move in moves[1:]:
+            if scores[move] > best_score:
+                best_move, best_score = move, scores[move]
         return best_move, best_score
 
-    # ------------------------------------------------------------------
-    # Alpha-Beta search (recursive, single-process)
-    # ------------------------------------------------------------------
-    def alphabeta_search(self, board, depth, alpha, beta, maximizing_player):
+    def _pool_map(self, tasks):
         """
-        Standard recursive alpha-beta search used in the main process.
+        Run root tasks on the persistent pool, creating it on first use.
+        Returns the (move, score) results of all chunks, flattened.
         """
-        self.nodes_evaluated += 1
-
-        color = self.color if maximizing_player else -self.color
-        legal_moves = self.game.get_legal_moves(board, color)
+        if search_nb is not None:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=cpu_count())
+            chunks = self._pool.map(self._thread_worker, tasks)
+        else:
+            if self._pool is None:
+                self._pool = Pool(processes=cpu_count(), initializer=_init_worker,
+                                  initargs=(self._stop,))
+            chunks = self._pool.map(_parallel_worker, tasks)
+        return [result for chunk in chunks for result in chunk]
 
-        # Terminal conditions
-        if depth == 0 or not legal_moves or self.time_exceeded():
-            return None, self.evaluate(board)
+    def _thread_worker(self, args):
+        """
+        Thread-pool counterpart of _parallel_worker: searches a chunk of root
+        moves with the nogil Numba kernel against the shared transposition
+        table.
+        """
+        board, key, moves, depth, color, alpha, beta = args
+        counters = np.zeros(1, dtype=np.int64)
+        results = []
+        for move in moves:
+            new_board, new_key = _play_root_move(board, key, move, color)
+            opp, own = split_board(new_board, color)
+            score = -search_nb.search(own, opp, new_key, 0 if color == WHITE else 1,
+                                      depth - 1, -beta, -alpha, -1, self._tables, counters,
+                                      self._stop_nb)
+            results.append((move, score))
+        with self._nodes_lock:
+            self._counters[0] += counters[0]
+            self.nodes_evaluated = int(self._counters[0])
+        return results
 
-        best_move = None
+    # ------------------------------------------------------------------
+    # Alpha-Beta search (single-process)
+    # ------------------------------------------------------------------
+    def alphabeta_search(self, board, depth, alpha, beta, maximizing_player, key=None):
+        """
+        Minimax-style entry point to the alpha-beta search used in the
+        main process; the search itself is the iterative negamax_search,
+        whose side-to-move score is negated back for minimizing nodes.
 
-        if maximizing_player:
-            max_eval = -math.inf
-            for move in legal_moves:
-                if self.time_exceeded():
-                    break
+        key is the Zobrist hash of (board, side to move); positions are
+        cached in self.tt as (depth, flag, value, best_bit) and the stored
+        best move is searched first.
 
-                new_board = self.game.apply_move(board, move, color)
-                _, eval_val = self.alphabeta_search(
-                    new_board,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    False
-                )
-
-                if eval_val > max_eval or best_move is None:
-                    max_eval = eval_val
-                    best_move = move
-
-                alpha = max(alpha, eval_val)
-                if beta <= alpha:
-                    break
+        When the Numba kernel is available the whole subtree is searched
+        natively; the kernel returns a negamax score, so it is negated back
+        for minimizing nodes and no best move is reported.
+        """
+        color = self.color if maximizing_player else -self.color
+        if key is None:
+            key = zobrist_hash(board, color)
+
+        if search_nb is not None:
+            own, opp = split_board(board, color)
+            sign = 1 if maximizing_player else -1
+            side = 0 if color == BLACK else 1
+            if maximizing_player:
+                value = search_nb.search(own, opp, key, side, depth, alpha, beta, sign,
+                                         self._tables, self._counters, self._stop_nb)
+            else:
+                value = -search_nb.search(own, opp, key, side, depth, -beta, -alpha, sign,
+                                          self._tables, self._counters, self._stop_nb)
+            self.nodes_evaluated = int(self._counters[0])
+            return None, value
 
-            return best_move, max_eval
+        if maximizing_player:
+            best_bit, value, nodes = negamax_search(
+                board, key, depth, alpha, beta, color, self.color,
+                self.tt, self._movegen_cache, self.time_exceeded)
         else:
-            min_eval = math.inf
-            for move in legal_moves:
-                if self.time_exceeded():
-                    break
-
-                new_board = self.game.apply_move(board, move, color)
-                _, eval_val = self.alphabeta_search(
-                    new_board,
-                    depth - 1,
-                    alpha,
-                    beta,
-                    True
-                )
-
-                if eval_val < min_eval or best_move is None:
-                    min_eval = eval_val
-                    best_move = move
-
-                beta = min(beta, eval_val)
-                if beta <= alpha:
-                    break
+            best_bit, value, nodes = negamax_search(
+                board, key, depth, -beta, -alpha, color, self.color,
+                self.tt, self._movegen_cache, self.time_exceeded)
+            value = -value
+        self.nodes_evaluated += nodes
 
-            return best_move, min_eval
+        return (bit_to_square(best_bit) if best_bit else None), value
 
-    # ------------------------------------------------------------------
-    # Evaluation (main process, same heuristic as evaluate_board)
-    # ------------------------------------------------------------------
-    def evaluate(self, board):
+    @staticmethod
+    def _order_root_moves(moves, pv_move):
         """
-        Weighted evaluation of the board (same logic as evaluate_board),
-        but from self.color's perspective.
+        Order root moves: the previous iteration's best move first,
+        then corners, then the rest, X-squares last.
         """
-        # Material
-        black_count = sum(row.count(BLACK) for row in board)
-        white_count = sum(row.count(WHITE) for row in board)
-        material = black_count - white_count if self.color == BLACK else white_count - black_count
-
-        # Mobility
-        my_moves = len(self.game.get_legal_moves(board, self.color))
-        opp_moves = len(self.game.get_legal_moves(board, -self.color))
-        mobility = 0
-        if my_moves + opp_moves != 0:
-            mobility = my_moves - opp_moves
-
-        # Corners
-        corners_idx = [(0, 0), (0, 7), (7, 0), (7, 7)]
-        my_corners = sum(1 for i, j in corners_idx if board[i][j] == self.color)
-        opp_corners = sum(1 for i, j in corners_idx if board[i][j] == -self.color)
-        corners = my_corners - opp_corners
-
-        # Edges
-        my_edges = 0
-        opp_edges = 0
-        for i in [0, 7]:
-            for j in range(8):
-                if board[i][j] == self.color:
-                    my_edges += 1
-                elif board[i][j] == -self.color:
-                    opp_edges += 1
-        for j in [0, 7]:
-            for i in range(1, 7):
-                if board[i][j] == self.color:
-                    my_edges += 1
-                elif board[i][j] == -self.color:
-                    opp_edges += 1
-        edges = my_edges - opp_edges
-
-        # Stability proxy
-        stability = 0
-        for ci, cj in corners_idx:
-            if board[ci][cj] == self.color:
-                stability += 1
-                for di in range(-1, 2):
-                    for dj in range(-1, 2):
-                        if di == 0 and dj == 0:
-                            continue
-                        ni, nj = ci + di, cj + dj
-                        if 0 <= ni < 8 and 0 <= nj < 8 and board[ni][nj] == self.color:
-                            stability += 1
-
-        score = (
-            WEIGHTS["material"] * material +
-            WEIGHTS["mobility"] * mobility +
-            WEIGHTS["corner"] * corners +
-            WEIGHTS["edge"] * edges +
-            WEIGHTS["stability"] * stability
-        )
-        return score
+        def rank(move):
+            if move == pv_move:
+                return -1
+            bit = square_bit(*move)
+            return next(i for i, mask in enumerate(MOVE_ORDER_MASKS) if bit & mask)
+        return sorted(moves, key=rank)
@@ -24,6 +24,15 @@ TIME_LIMIT = 30
 DMAX = 9   # recommended performance mode
 # DMAX = 10  # experimental deeper mode (may not finish early-game)
 
+# Transposition table capacity (entries, power of two)
+TT_SIZE = 1 << 20
+
+# Dict transposition table capacity for the pure-Python search (entries)
+PY_TT_SIZE = 1 << 17
+
+# Legal-move cache capacity for the pure-Python search (entries)
+MOVEGEN_CACHE_SIZE = 1 << 18
+
 # Evaluation weights (from your specification)
 WEIGHTS = {
     "material": 10,
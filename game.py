@@ -1,13 +1,218 @@
-import copy
+import random
 from config import BOARD_SIZE, EMPTY, BLACK, WHITE, CHAR_MAP, DIRECTIONS
 
+# Bitboard layout: bit (row * 8 + col) is set when a disc occupies (row, col).
+# A board state is an immutable (black, white) tuple of 64-bit ints.
+FULL = 0xFFFFFFFFFFFFFFFF
+NOT_A_FILE = 0xFEFEFEFEFEFEFEFE  # clears column 0 (wrap-around after shifting east)
+NOT_H_FILE = 0x7F7F7F7F7F7F7F7F  # clears column 7 (wrap-around after shifting west)
+
+# (shift, wrap mask) pairs for the 8 directions.
+# Left shifts move towards higher rows/cols, right shifts towards lower ones.
+_LEFT_SHIFTS = ((1, NOT_A_FILE), (7, NOT_H_FILE), (8, FULL), (9, NOT_A_FILE))
+_RIGHT_SHIFTS = ((1, NOT_H_FILE), (7, NOT_A_FILE), (8, FULL), (9, NOT_H_FILE))
+
+
+# Zobrist keys: ZOBRIST[square][0] for black discs, [1] for white discs,
+# plus one key toggled when White is to move. Fixed seed so every process
+# (and the Numba kernel) agrees on the same keys.
+_zobrist_rng = random.Random(0x07E110)
+ZOBRIST = [[_zobrist_rng.getrandbits(64), _zobrist_rng.getrandbits(64)] for _ in range(BOARD_SIZE * BOARD_SIZE)]
+ZOBRIST_SIDE = _zobrist_rng.getrandbits(64)
+ZOBRIST_FLIP = [zb ^ zw for zb, zw in ZOBRIST]  # a disc changing colour
+
+
+def zobrist_hash(board, color):
+    #Full Zobrist hash of board with color to move.
+    black, white = board
+    key = ZOBRIST_SIDE if color == WHITE else 0
+    for i in range(BOARD_SIZE * BOARD_SIZE):
+        bit = 1 << i
+        if black & bit:
+            key ^= ZOBRIST[i][0]
+        elif white & bit:
+            key ^= ZOBRIST[i][1]
+    return key
+
+
+def zobrist_update(key, move_bit, flips, color):
+    #Hash of the child position after color plays move_bit flipping flips.
+    key ^= ZOBRIST_SIDE ^ ZOBRIST[move_bit.bit_length() - 1][0 if color == BLACK else 1]
+    while flips:
+        bit = flips & -flips
+        key ^= ZOBRIST_FLIP[bit.bit_length() - 1]
+        flips ^= bit
+    return key
+
+
+def square_bit(row, col):
+    #Return the bitboard bit for (row, col).
+    return 1 << (row * BOARD_SIZE + col)
+
+
+def bit_to_square(bit):
+    #Return (row, col) for a single-bit bitboard.
+    return divmod(bit.bit_length() - 1, BOARD_SIZE)
+
+
+def bits_to_squares(mask):
+    #Return the (row, col) squares set in mask, in row-major order.
+    squares = []
+    while mask:
+        bit = mask & -mask
+        squares.append(bit_to_square(bit))
+        mask ^= bit
+    return squares
+
+
+def _legal_moves_mask(own, opp):
+    #Dumb7Fill move generation: bitboard of empty squares that flip at least one disc.
+    empty = ~(own | opp) & FULL
+    moves = 0
+    for s, mask in _LEFT_SHIFTS:
+        targets = opp & mask
+        x = targets & (own << s)
+        for _ in range(5):
+            x |= targets & (x << s)
+        moves |= empty & mask & (x << s)
+    for s, mask in _RIGHT_SHIFTS:
+        targets = opp & mask
+        x = targets & (own >> s)
+        for _ in range(5):
+            x |= targets & (x >> s)
+        moves |= empty & mask & (x >> s)
+    return moves
+
+
+def _build_rays():
+    #Per square, the bits along each direction that stays on the board for
+    #at least two squares (a shorter ray can never bracket a disc).
+    rays = []
+    for i in range(BOARD_SIZE * BOARD_SIZE):
+        row, col = divmod(i, BOARD_SIZE)
+        square_rays = []
+        for dr, dc in DIRECTIONS:
+            ray = []
+            r, c = row + dr, col + dc
+            while 0 <= r < BOARD_SIZE and 0 <= c < BOARD_SIZE:
+                ray.append(square_bit(r, c))
+                r, c = r + dr, c + dc
+            if len(ray) >= 2:
+                square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+_RAYS = _build_rays()
+
+
+def _mobility_masks(own, opp):
+    #Legal-move bitboards of both sides, (own_moves, opp_moves), in one
+    #Dumb7Fill pass sharing the shift loop and the empty-square mask.
+    empty = ~(own | opp) & FULL
+    own_moves = opp_moves = 0
+    for s, mask in _LEFT_SHIFTS:
+        own_targets = opp & mask
+        opp_targets = own & mask
+        x = own_targets & (own << s)
+        y = opp_targets & (opp << s)
+        for _ in range(5):
+            x |= own_targets & (x << s)
+            y |= opp_targets & (y << s)
+        own_moves |= mask & (x << s)
+        opp_moves |= mask & (y << s)
+    for s, mask in _RIGHT_SHIFTS:
+        own_targets = opp & mask
+        opp_targets = own & mask
+        x = own_targets & (own >> s)
+        y = opp_targets & (opp >> s)
+        for _ in range(5):
+            x |= own_targets & (x >> s)
+            y |= opp_targets & (y >> s)
+        own_moves |= mask & (x >> s)
+        opp_moves |= mask & (y >> s)
+    return own_moves & empty, opp_moves & empty
+
+
+def _flip_mask(own, opp, move_bit):
+    #Bitboard of opponent discs flipped by placing own disc on move_bit.
+    #Walks the precomputed rays of the square, so off-board directions are
+    #never visited and most rays stop after one lookup.
+    flips = 0
+    for ray in _RAYS[move_bit.bit_length() - 1]:
+        line = 0
+        for bit in ray:
+            if opp & bit:
+                line |= bit
+            else:
+                if own & bit:
+                    flips |= line
+                break
+    return flips
+
+
+# Board-state functions. They only read the board passed in, so the search
+# (and worker processes) can call them without an OthelloGame instance.
+def split_board(board, color):
+    #Return (own, opp) bitboards of board from color's point of view.
+    black, white = board
+    return (black, white) if color == BLACK else (white, black)
+
+
+def get_legal_moves_bb(board, color):
+    #Return legal moves for given board state and color as a bitboard.
+    own, opp = split_board(board, color)
+    return _legal_moves_mask(own, opp)
+
+
+def get_mobility_bb(board, color):
+    #Return (color's, opponent's) legal-move bitboards in one pass.
+    own, opp = split_board(board, color)
+    return _mobility_masks(own, opp)
+
+
+def get_legal_moves(board, color):
+    #Return legal moves for given board state and color.
+    return bits_to_squares(get_legal_moves_bb(board, color))
+
+
+def get_flips_bb(board, move_bit, color):
+    #Return the bitboard of discs flipped by color playing move_bit.
+    own, opp = split_board(board, color)
+    return _flip_mask(own, opp, move_bit)
+
+
+def apply_move_bb(board, move_bit, color, flips=None):
+    #Apply a single-bit move to a board state (for AI simulation).
+    #Returns new (black, white) board state; the input is left untouched.
+    #flips may be passed in when the caller has already computed it.
+    #The update is a pure XOR, so applying the same move and flips
+    #again restores the original board (used by undo).
+    black, white = board
+    if color == BLACK:
+        if flips is None:
+            flips = _flip_mask(black, white, move_bit)
+        return black ^ (flips | move_bit), white ^ flips
+    if flips is None:
+        flips = _flip_mask(white, black, move_bit)
+    return black ^ flips, white ^ (flips | move_bit)
+
+
+def apply_move(board, move, color):
+    #Apply move to a board state (for AI simulation).
+    #Returns new board state.
+    if move is None:
+        return board
+
+    row, col = move
+    return apply_move_bb(board, square_bit(row, col), color)
+
 
 class OthelloGame:
     def __init__(self):
        #Initialize the Othello game board and history.
-        self.board = [[EMPTY for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
         self.history = []  # For undo functionality
-        
+
         # Starting position (origin at bottom-left)
         # Center four squares: (3,3), (3,4), (4,3), (4,4)
         # Assignment spec: "left-upper of center is white"
@@ -16,21 +221,30 @@ class OthelloGame:
         #   (3,4) = right-lower of center = WHITE
         #   (3,3) = left-lower of center = BLACK
         #   (4,4) = right-upper of center = BLACK
-        
-        self.board[3][3] = BLACK   # Bottom-left of center
-        self.board[3][4] = WHITE   # Bottom-right of center
-        self.board[4][3] = WHITE   # Top-left of center
-        self.board[4][4] = BLACK   # Top-right of center
+
+        black = square_bit(3, 3) | square_bit(4, 4)   # Bottom-left / top-right of center
+        white = square_bit(3, 4) | square_bit(4, 3)   # Bottom-right / top-left of center
+        self.board = (black, white)
 
     def __str__(self):
-       
+
         lines = []
         lines.append("  " + " ".join(str(c) for c in range(BOARD_SIZE)))
         for i in range(BOARD_SIZE - 1, -1, -1):  # Print from row 7 down to 0
-            row_str = str(i) + " " + " ".join(CHAR_MAP[self.board[i][j]] for j in range(BOARD_SIZE))
+            row_str = str(i) + " " + " ".join(CHAR_MAP[self.piece_at(i, j)] for j in range(BOARD_SIZE))
             lines.append(row_str)
         return "\n".join(lines)
 
+    def piece_at(self, row, col, board=None):
+        #Return EMPTY, BLACK or WHITE for (row, col) on board (defaults to the game board).
+        black, white = self.board if board is None else board
+        bit = square_bit(row, col)
+        if black & bit:
+            return BLACK
+        if white & bit:
+            return WHITE
+        return EMPTY
+
     def is_valid_position(self, row, col):
         #Check if position is within board bounds.
         return 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE
@@ -42,91 +256,35 @@ class OthelloGame:
     def is_valid_move(self, row, col, color):
         #Check if placing a disc at (row, col) is valid.
         #Must flip at least one opponent disc.
-    
-        if not self.is_valid_position(row, col):
-            return False
-        
-        if self.board[row][col] != EMPTY:
+
+        if not self.is_valid_position(row, col) or self.piece_at(row, col) != EMPTY:
             return False
-        
-        opponent = self.get_opponent(color)
-        
-        # Check all 8 directions
-        for dr, dc in DIRECTIONS:
-            r, c = row + dr, col + dc
-            found_opponent = False
-            
-            # Move in this direction
-            while self.is_valid_position(r, c) and self.board[r][c] == opponent:
-                found_opponent = True
-                r += dr
-                c += dc
-            
-            # Valid if we found opponent(s) and ended with our color
-            if found_opponent and self.is_valid_position(r, c) and self.board[r][c] == color:
-                return True
-        
-        return False
+
+        return bool(self._flips_no_check(row, col, color))
 
     def legal_moves(self, color):
        #Return list of legal moves for given color.
-        moves = []
-        for i in range(BOARD_SIZE):
-            for j in range(BOARD_SIZE):
-                if self.is_valid_move(i, j, color):
-                    moves.append((i, j))
-        return moves
+        return self.get_legal_moves(self.board, color)
+
+    def get_legal_moves_bb(self, board, color):
+        #Return legal moves for given board state and color as a bitboard.
+        return get_legal_moves_bb(board, color)
 
     def get_legal_moves(self, board, color):
         #Return legal moves for given board state and color.
-        moves = []
-        opponent = self.get_opponent(color)
-        
-        for i in range(BOARD_SIZE):
-            for j in range(BOARD_SIZE):
-                if board[i][j] != EMPTY:
-                    continue
-                
-                # Check all 8 directions
-                for dr, dc in DIRECTIONS:
-                    r, c = i + dr, j + dc
-                    found_opponent = False
-                    
-                    while self.is_valid_position(r, c) and board[r][c] == opponent:
-                        found_opponent = True
-                        r += dr
-                        c += dc
-                    
-                    if found_opponent and self.is_valid_position(r, c) and board[r][c] == color:
-                        moves.append((i, j))
-                        break  # Found valid direction, no need to check others
-        
-        return moves
+        return get_legal_moves(board, color)
 
     def flip_discs(self, row, col, color):
        #Flip opponent discs for a move at (row, col). Returns list of flipped positions.
-        if not self.is_valid_move(row, col, color):
+        if not self.is_valid_position(row, col) or self.piece_at(row, col) != EMPTY:
             return []
-        
-        opponent = self.get_opponent(color)
-        flipped = []
-        
-        # Check all 8 directions
-        for dr, dc in DIRECTIONS:
-            temp_flipped = []
-            r, c = row + dr, col + dc
-            
-            # Collect opponent discs in this direction
-            while self.is_valid_position(r, c) and self.board[r][c] == opponent:
-                temp_flipped.append((r, c))
-                r += dr
-                c += dc
-            
-            # If we ended with our color, flip all collected discs
-            if temp_flipped and self.is_valid_position(r, c) and self.board[r][c] == color:
-                flipped.extend(temp_flipped)
-        
-        return flipped
+
+        return bits_to_squares(self._flips_no_check(row, col, color))
+
+    def _flips_no_check(self, row, col, color):
+        #Bitboard of discs color would flip at (row, col) on the game board.
+        #Assumes an in-bounds, empty square; a move is legal iff this is non-zero.
+        return get_flips_bb(self.board, square_bit(row, col), color)
 
     def make_move(self, move, color):
         #Make a move for the given color. Returns True if successful.
@@ -135,106 +293,75 @@ class OthelloGame:
             self.history.append({
                 'move': None,
                 'color': color,
-                'flipped': []
+                'flipped': 0
             })
             return True
-        
+
         row, col = move
-        
-        if not self.is_valid_move(row, col, color):
+
+        if not self.is_valid_position(row, col) or self.piece_at(row, col) != EMPTY:
+            return False
+
+        # Get discs to flip (as a bitboard); none means the move is illegal
+        flipped = self._flips_no_check(row, col, color)
+        if not flipped:
             return False
-        
-        # Get discs to flip
-        flipped = self.flip_discs(row, col, color)
-        
+        move_bit = square_bit(row, col)
+
         # Save state for undo
         self.history.append({
             'move': move,
             'color': color,
             'flipped': flipped
         })
-        
-        # Place disc
-        self.board[row][col] = color
-        
-        # Flip opponent discs
-        for r, c in flipped:
-            self.board[r][c] = color
-        
+
+        # Place disc and flip opponent discs
+        self.board = self.apply_move_bb(self.board, move_bit, color, flipped)
+
         return True
 
+    def apply_move_bb(self, board, move_bit, color, flips=None):
+        #Apply a single-bit move to a board state (see apply_move_bb).
+        return apply_move_bb(board, move_bit, color, flips)
+
     def apply_move(self, board, move, color):
-        #Apply move to a board copy (for AI simulation).
+        #Apply move to a board state (for AI simulation).
         #Returns new board state.
-        new_board = copy.deepcopy(board)
-        
-        if move is None:
-            return new_board
-        
-        row, col = move
-        opponent = self.get_opponent(color)
-        
-        # Place the disc
-        new_board[row][col] = color
-        
-        # Flip discs in all valid directions
-        for dr, dc in DIRECTIONS:
-            temp_flipped = []
-            r, c = row + dr, col + dc
-            
-            # Collect opponent discs
-            while self.is_valid_position(r, c) and new_board[r][c] == opponent:
-                temp_flipped.append((r, c))
-                r += dr
-                c += dc
-            
-            # Flip if we ended with our color
-            if temp_flipped and self.is_valid_position(r, c) and new_board[r][c] == color:
-                for fr, fc in temp_flipped:
-                    new_board[fr][fc] = color
-        
-        return new_board
+        return apply_move(board, move, color)
 
     def undo_last_move(self):
         #Undo the last move. Returns True if successful.
         if not self.history:
             return False
-        
+
         last = self.history.pop()
         move = last['move']
         color = last['color']
         flipped = last['flipped']
-        
+
         if move is None:
             # Was a pass, nothing to undo on board
             return True
-        
+
+        # Remove the placed disc and flip back opponent discs
         row, col = move
-        opponent = self.get_opponent(color)
-        
-        # Remove the placed disc
-        self.board[row][col] = EMPTY
-        
-        # Flip back opponent discs
-        for r, c in flipped:
-            self.board[r][c] = opponent
-        
+        self.board = self.apply_move_bb(self.board, square_bit(row, col), color, flipped)
+
         return True
 
     def count_discs(self):
         #Count discs for each color. Returns (black_count, white_count).
-        black = sum(row.count(BLACK) for row in self.board)
-        white = sum(row.count(WHITE) for row in self.board)
-        return black, white
+        black, white = self.board
+        return black.bit_count(), white.bit_count()
 
     def is_game_over(self):
         #Check if game is over (no legal moves for either player).
-        return not self.legal_moves(BLACK) and not self.legal_moves(WHITE)
+        return not self.get_legal_moves_bb(self.board, BLACK) and not self.get_legal_moves_bb(self.board, WHITE)
 
     def get_winner(self):
         #Get game winner. Returns BLACK, WHITE, or EMPTY (tie).
         #Should only be called when game is over.
-        
+
         black, white = self.count_discs()
         if black > white:
             return BLACK
@@ -1,22 +1,106 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import importlib
+import multiprocessing
+import collections
 import time
+import traceback
 from typing import Optional, Tuple
-from game import OthelloGame
+from game import OthelloGame, bits_to_squares, square_bit, zobrist_hash, zobrist_update, ZOBRIST_SIDE
 import config
 
-# Dynamic AI import (attempts to be compatible with multiple ai.py versions)
+# Dynamic AI import (attempts to be compatible with multiple ai.py versions).
+# Only the AI worker process imports ai, so numpy/numba never load in the GUI.
 _ai_mod = None
-try:
-    import importlib
-    _ai_mod = importlib.import_module('ai')
-except Exception as e:
-    print(f"Warning: Could not import ai module: {e}")
-    _ai_mod = None
+
+
+def _load_ai():
+    global _ai_mod
+    if _ai_mod is None:
+        try:
+            _ai_mod = importlib.import_module('ai')
+        except Exception as e:
+            print(f"Warning: Could not import ai module: {e}")
+    return _ai_mod
+
 
 Move = Tuple[int, int]
 
+_COLOR_NAMES = {config.BLACK: "Black", config.WHITE: "White"}
+
+# State of the AI worker process (see OthelloGUI._ai_pool). Agents live
+# here, one per colour, so their tables stay warm across turns.
+_proc_interface = None
+_proc_agent_cls = None
+_proc_agents = {}
+_proc_game = None
+_proc_stop = None
+
+
+def _init_ai_process(stop_event):
+    global _proc_stop
+    _proc_stop = stop_event
+
+
+def _detect_ai_interface() -> str:
+    # Runs in the worker process: import ai once and cache its agent class.
+    global _proc_interface, _proc_agent_cls
+    if _proc_interface is None:
+        mod = _load_ai()
+        _proc_interface = "none" if mod is None else 'unknown'
+        for name in ('OthelloAI', 'SearchAgent'):
+            if mod is not None and hasattr(mod, name):
+                _proc_interface, _proc_agent_cls = name, getattr(mod, name)
+                break
+    return _proc_interface
+
+
+def _ai_search_entry(board, key, color, time_limit, dmax):
+    # Runs in the worker process: search board for color and return the
+    # tagged messages ("log", msg) / ("done", move, elapsed, nodes) for _poll_ai.
+    global _proc_game
+    interface, agent_cls = _detect_ai_interface(), _proc_agent_cls
+    messages = []
+    best_move, nodes_info = None, "N/A"
+    start_time = time.perf_counter()
+    if _proc_game is None:
+        _proc_game = OthelloGame()
+    _proc_game.board = board
+
+    try:
+        if interface == 'OthelloAI':
+            agent = _proc_agents.get(color)
+            if agent is None:
+                agent = agent_cls(_proc_game, color, stop_event=_proc_stop)
+                _proc_agents[color] = agent
+            if hasattr(agent, 'set_state'):
+                agent.set_state(_proc_game, key)
+            else:
+                agent.game = _proc_game
+            best_move = agent.get_move()
+            nodes_info = getattr(agent, 'nodes_evaluated', 'N/A')
+        elif interface == 'SearchAgent':
+            agent = agent_cls(_proc_game, color, time_limit, dmax, stop_event=_proc_stop)
+            best_move = agent.iterative_deepening() if hasattr(agent, 'iterative_deepening') else agent.get_move()
+            nodes_info = getattr(agent, 'nodes', 'N/A')
+        else:
+            messages.append(('log', f"Unknown AI interface: {interface}"))
+    except Exception as ex:
+        messages.append(('log', f"AI error: {ex}"))
+        traceback.print_exc()
+
+    messages.append(('done', best_move, time.perf_counter() - start_time, nodes_info))
+    return messages
+
+
+def _close_ai_process_agents():
+    for agent in _proc_agents.values():
+        if hasattr(agent, 'close'):
+            agent.close()
+    _proc_agents.clear()
+
 
 class OthelloGUI:
     def __init__(self, root: tk.Tk):
@@ -33,8 +117,14 @@ class OthelloGUI:
         self.ai_mode = None  # 'vs_ai' or 'both'
 
         # Threading & AI
-        self.ai_thread: Optional[threading.Thread] = None
-        self.ai_stop_event = threading.Event()
+        self._hash = zobrist_hash(self.game.board, self.current_player)
+        self._black_count, self._white_count = self.game.count_discs()
+        self._legal_cache = {}  # (self._hash, color) -> frozenset of legal moves
+        # Searches run in one worker process so pure-Python search never
+        # holds the GUI's GIL; the event is shared with it to cancel them.
+        self.ai_stop_event = multiprocessing.Event()
+        self._ai_pool = self._new_ai_pool()
+        self._ai_future: Optional[concurrent.futures.Future] = None
         self.ai_start_time = None
 
         # Game over flag
@@ -53,6 +143,8 @@ class OthelloGUI:
         )
         self.canvas.grid(row=0, column=0, columnspan=4, padx=8, pady=8)
         self.canvas.bind('<Button-1>', self.on_canvas_click)
+        self._create_board_items()
+        self.canvas.bind('<Configure>', self._on_canvas_configure)
 
         # Info label
         self.info_label = tk.Label(
@@ -145,6 +237,8 @@ class OthelloGUI:
         )
         speed_combo.current(3)
         speed_combo.grid(row=0, column=1, sticky='w', padx=5)
+        speed_combo.bind('<<ComboboxSelected>>', self._on_speed_change)
+        self._speed_ms = 1000  # parsed speed_var, refreshed on selection
 
         # Time limit
         ttk.Label(settings_frame, text='Time limit (s):').grid(row=0, column=2, sticky='e', padx=5)
@@ -182,19 +276,26 @@ class OthelloGUI:
         # Pause flag
         self.paused = False
 
+        # Batched UI updates: while batching, draw_board/update_score only
+        # record what is dirty and _flush_ui applies it in one go
+        self._batching = False
+        self._dirty = {'board': False, 'score': False}
+
+        # Log lines waiting to be written by _flush_log (one insert per idle tick)
+        self._log_buf = collections.deque()
+        self._log_flush_pending = False
+
         # Initial setup
         self.draw_board()
         self.on_mode_change()
-        self._ai_interface = self.detect_ai_interface()
-        self.append_log(f"AI interface detected: {self._ai_interface}")
+        # Detected in the worker, which also warms up ai in the background
+        self._ai_interface = None
+        self._ai_detect = self._submit_ai(_detect_ai_interface)
+        self.root.after(50, self.detect_ai_interface)
         self.append_log("Configure settings and click 'Start New Game' to begin!")
 
     def _color_to_str(self, color: int) -> str:
-        if color == config.BLACK:
-            return "Black"
-        elif color == config.WHITE:
-            return "White"
-        return "Unknown"
+        return _COLOR_NAMES.get(color, "Unknown")
 
     def on_mode_change(self):
         if self.game_mode_var.get() == 'Human vs AI':
@@ -204,13 +305,20 @@ class OthelloGUI:
             self.human_options_frame.grid_remove()
             self.first_player_frame.grid()
 
-    def detect_ai_interface(self) -> str:
-        if _ai_mod is None: return "none"
-        if hasattr(_ai_mod, 'OthelloAI'): return 'OthelloAI'
-        if hasattr(_ai_mod, 'SearchAgent'): return 'SearchAgent'
-        return 'unknown'
+    def detect_ai_interface(self):
+        # Polled on the Tk thread until the worker reports the interface.
+        if not self._ai_detect.done():
+            self.root.after(50, self.detect_ai_interface)
+            return
+        try:
+            self._ai_interface = self._ai_detect.result()
+        except Exception as ex:  # e.g. the worker process died
+            self._ai_interface = "none"
+            self.append_log(f"AI error: {ex}")
+        self.append_log(f"AI interface detected: {self._ai_interface}")
 
     def start_new_game(self):
+        self._close_agents()
         self.game = OthelloGame()
         self.game_over = False
         self.paused = False
@@ -226,6 +334,9 @@ class OthelloGUI:
             self.human_color = None
             self.ai_color = None
             self.current_player = self.first_player_var.get()
+        self._hash = zobrist_hash(self.game.board, self.current_player)
+        self._black_count, self._white_count = self.game.count_discs()
+        self._legal_cache.clear()
 
         # Read settings
         try:
@@ -236,18 +347,18 @@ class OthelloGUI:
             return
 
         # Clear log and update UI
+        self._log_buf.clear()
         self.move_log.config(state='normal')
         self.move_log.delete('1.0', 'end')
         self.move_log.config(state='disabled')
         
-        self.append_log("=" * 60)
-        self.append_log(f"NEW GAME: {self.game_mode_var.get()}")
+        header = ["=" * 60, f"NEW GAME: {self.game_mode_var.get()}"]
         if self.ai_mode == 'vs_ai':
             human_str = self._color_to_str(self.human_color)
             ai_str = self._color_to_str(self.ai_color)
-            self.append_log(f"Human: {human_str}, AI: {ai_str}")
-        self.append_log(f"Time: {self.time_limit}s, Depth: {self.dmax}")
-        self.append_log("=" * 60)
+            header.append(f"Human: {human_str}, AI: {ai_str}")
+        header += [f"Time: {self.time_limit}s, Depth: {self.dmax}", "=" * 60]
+        self.append_log_block(header)
 
         self.draw_board()
         self.update_score()
@@ -256,7 +367,11 @@ class OthelloGUI:
     def next_turn(self):
         if self.game_over: return
         self.update_info_label()
-        self.draw_board() # Redraw to update legal moves highlight
+        # Redraw to update legal moves highlight, unless nothing visible
+        # changed (e.g. an AI turn after a pass: same discs, no highlight)
+        if (self.game.board != self.prev_board or self.prev_legal
+                or self.current_player == self.human_color):
+            self.draw_board()
 
         if self.current_player == self.human_color:
             self.pause_button.config(state='disabled')
@@ -272,56 +387,111 @@ class OthelloGUI:
             return
 
         pad = config.CANVAS_PADDING
-        size = config.CELL_SIZE
+        size = self._cell_size
         c = (event.x - pad) // size
         r = config.BOARD_SIZE - 1 - ((event.y - pad) // size)
 
         if 0 <= r < config.BOARD_SIZE and 0 <= c < config.BOARD_SIZE:
             move = (int(r), int(c))
-            if move in self.game.legal_moves(self.human_color):
-                self.game.make_move(move, self.human_color)
-                human_str = self._color_to_str(self.human_color)
-                self.append_log(f"Human ({human_str}) -> {move}")
-                self.update_score()
-                
-                if self.check_game_over(): return
-                
-                self.current_player = self.game.get_opponent(self.current_player)
-                self.next_turn()
+            if move in self._legal(self.human_color):
+                self._begin_batch()
+                try:
+                    self._play(move, self.human_color)
+                    human_str = self._color_to_str(self.human_color)
+                    self.append_log(f"Human ({human_str}) -> {move}")
+                    self.update_score()
+
+                    if self.check_game_over(): return
+
+                    self.current_player = self.game.get_opponent(self.current_player)
+                    self.next_turn()
+                finally:
+                    self._end_batch()
             else:
                 self.append_log(f"Invalid move: {move}")
 
-    def draw_board(self):
-        self.canvas.delete('all')
-        size = config.CELL_SIZE
+    def _build_cell_geometry(self, size=None):
+        # Pixel boxes of all cells and label anchors, recomputed only on resize.
+        size = config.CELL_SIZE if size is None else size
         pad = config.CANVAS_PADDING
-        
-        legal_moves = []
+        n = config.BOARD_SIZE
+
+        self._cell_size = size
+        self._cell_rc = [(r, c) for r in range(n) for c in range(n)]
+        self._cell_bbox = [
+            (pad + c * size, pad + (n - 1 - r) * size, pad + (c + 1) * size, pad + (n - r) * size)
+            for r, c in self._cell_rc
+        ]
+        self._label_xy = (
+            [(pad + c * size + size / 2, pad/2) for c in range(n)] +
+            [(pad/2, pad + (n - 1 - r) * size + size / 2) for r in range(n)]
+        )
+
+    def _create_board_items(self):
+        # Create every canvas item once; draw_board only reconfigures them.
+        n = config.BOARD_SIZE
+        self._build_cell_geometry()
+
+        self.cell_items = [[None] * n for _ in range(n)]
+        self.piece_items = [[None] * n for _ in range(n)]
+        for (r, c), (x0, y0, x1, y1) in zip(self._cell_rc, self._cell_bbox):
+            self.cell_items[r][c] = self.canvas.create_rectangle(
+                x0, y0, x1, y1, outline='black', fill='darkgreen')
+            self.piece_items[r][c] = self.canvas.create_oval(
+                x0+6, y0+6, x1-6, y1-6, outline='gray', width=2, state='hidden')
+
+        # Column labels 0..n-1, then row labels 0..n-1
+        self.label_items = [
+            self.canvas.create_text(x, y, text=str(i % n), fill='white', font=('Arial', 9, 'bold'))
+            for i, (x, y) in enumerate(self._label_xy)
+        ]
+
+        # What the canvas currently shows: an empty board, nothing highlighted
+        self.prev_board = (0, 0)
+        self.prev_legal = frozenset()
+
+    def _on_canvas_configure(self, event):
+        # Rescale the board when the canvas size actually changes.
+        inset = 2 * (int(self.canvas['highlightthickness']) + int(self.canvas['borderwidth']))
+        size = (min(event.width, event.height) - inset - 2 * config.CANVAS_PADDING) // config.BOARD_SIZE
+        if size <= 0 or size == self._cell_size:
+            return
+        self._build_cell_geometry(size)
+        for (r, c), (x0, y0, x1, y1) in zip(self._cell_rc, self._cell_bbox):
+            self.canvas.coords(self.cell_items[r][c], x0, y0, x1, y1)
+            self.canvas.coords(self.piece_items[r][c], x0+6, y0+6, x1-6, y1-6)
+        for item, (x, y) in zip(self.label_items, self._label_xy):
+            self.canvas.coords(item, x, y)
+
+    def draw_board(self):
+        if self._batching:
+            self._dirty['board'] = True
+            return
+        self._render_board()
+
+    def _render_board(self):
+        legal_moves = frozenset()
         if self.current_player == self.human_color and not self.game_over:
-            legal_moves = self.game.legal_moves(self.human_color)
-
-        for r in range(config.BOARD_SIZE):
-            for c in range(config.BOARD_SIZE):
-                x0, y0 = pad + c * size, pad + (config.BOARD_SIZE - 1 - r) * size
-                x1, y1 = x0 + size, y0 + size
-                
-                fill_color = 'darkgreen'
-                if (r, c) in legal_moves:
-                    fill_color = 'forestgreen' # Highlight legal moves
-
-                self.canvas.create_rectangle(x0, y0, x1, y1, outline='black', fill=fill_color)
-                
-                piece = self.game.board[r][c]
-                if piece != config.EMPTY:
-                    color = 'black' if piece == config.BLACK else 'white'
-                    self.canvas.create_oval(x0+6, y0+6, x1-6, y1-6, fill=color, outline='gray', width=2)
-        
-        for c in range(config.BOARD_SIZE):
-            x = pad + c * size + size / 2
-            self.canvas.create_text(x, pad/2, text=str(c), fill='white', font=('Arial', 9, 'bold'))
-        for r in range(config.BOARD_SIZE):
-            y = pad + (config.BOARD_SIZE - 1 - r) * size + size / 2
-            self.canvas.create_text(pad/2, y, text=str(r), fill='white', font=('Arial', 9, 'bold'))
+            legal_moves = self._legal(self.human_color)
+
+        # Only squares whose disc changed since the last draw
+        black, white = self.game.board
+        prev_black, prev_white = self.prev_board
+        for r, c in bits_to_squares((black ^ prev_black) | (white ^ prev_white)):
+            piece = self.game.piece_at(r, c)
+            if piece == config.EMPTY:
+                self.canvas.itemconfig(self.piece_items[r][c], state='hidden')
+            else:
+                color = 'black' if piece == config.BLACK else 'white'
+                self.canvas.itemconfig(self.piece_items[r][c], fill=color, state='normal')
+
+        # Highlight legal moves; only squares entering or leaving the set
+        for r, c in legal_moves ^ self.prev_legal:
+            fill_color = 'forestgreen' if (r, c) in legal_moves else 'darkgreen'
+            self.canvas.itemconfig(self.cell_items[r][c], fill=fill_color)
+
+        self.prev_board = self.game.board
+        self.prev_legal = legal_moves
 
     def toggle_pause(self):
         if self.ai_mode != 'both':
@@ -329,6 +499,8 @@ class OthelloGUI:
             return
         self.paused = not self.paused
         if self.paused:
+            # Cut the in-flight search short; its move is discarded while paused
+            self.ai_stop_event.set()
             self.append_log("Game PAUSED")
             self.info_label.config(text="Game PAUSED")
         else:
@@ -339,18 +511,18 @@ class OthelloGUI:
         if self.game_over or self.paused or self.current_player == self.human_color:
             return
             
-        if _ai_mod is None:
+        if self._ai_interface == "none":
             messagebox.showerror("AI Error", "ai.py not found or failed to import.")
             return
 
-        if self.ai_thread and self.ai_thread.is_alive(): return
+        if self._ai_future is not None and not self._ai_future.done(): return
 
-        legal = self.game.legal_moves(self.current_player)
+        legal = self._legal(self.current_player)
         color_name = self._color_to_str(self.current_player)
         
         if not legal:
             self.append_log(f"AI {color_name} has no legal moves - PASS")
-            self.game.make_move(None, self.current_player)
+            self._play(None, self.current_player)
             self.current_player = self.game.get_opponent(self.current_player)
             if self.check_game_over(): return
             self.next_turn()
@@ -358,86 +530,144 @@ class OthelloGUI:
 
         self.append_log(f"AI {color_name} thinking... ({len(legal)} legal moves)")
         self.ai_stop_event.clear()
-        self.ai_start_time = time.time()
-        self.ai_thread = threading.Thread(target=self._ai_worker, daemon=True)
-        self.ai_thread.start()
+        self.ai_start_time = time.perf_counter()
+        self._ai_future = self._submit_ai(
+            _ai_search_entry, self.game.board, self._hash,
+            self.current_player, self.time_limit, self.dmax)
+        self.root.after_idle(self._poll_ai)
+
+    def _on_speed_change(self, event=None):
+        try:
+            self._speed_ms = int(self.speed_var.get().split()[0])
+        except (ValueError, IndexError):
+            self._speed_ms = 1000
 
     def get_speed_delay(self) -> int:
+        return self._speed_ms
+
+    def _poll_ai(self):
+        # Runs on the Tk thread, which performs every widget update for the
+        # search: log lines are tagged ('log', msg), the result ('done', ...).
+        if not self._ai_future.done():
+            self.root.after(5, self._poll_ai)
+            return
         try:
-            return int(self.speed_var.get().split()[0])
-        except:
-            return 1000
+            messages = self._ai_future.result()
+        except Exception as ex:  # e.g. the worker process died
+            messages = [('log', f"AI error: {ex}"),
+                        ('done', None, time.perf_counter() - self.ai_start_time, "N/A")]
+        for tag, *payload in messages:
+            if tag == 'log':
+                self.append_log(*payload)
+            elif tag == 'done':
+                self._apply_ai_move(*payload)
 
-    def _ai_worker(self):
-        ai_color = self.current_player
-        best_move, nodes_info = None, "N/A"
-        start_time = time.time()
+    def _apply_ai_move(self, best_move, elapsed, nodes_info):
+        if self.game_over or self.paused: return
 
+        self._begin_batch()
         try:
-            if self._ai_interface == 'OthelloAI':
-                agent = getattr(_ai_mod, 'OthelloAI')(self.game, ai_color)
-                best_move = agent.get_move()
-                nodes_info = getattr(agent, 'nodes_evaluated', 'N/A')
-            elif self._ai_interface == 'SearchAgent':
-                agent = getattr(_ai_mod, 'SearchAgent')(self.game, ai_color, self.time_limit, self.dmax)
-                best_move = agent.iterative_deepening() if hasattr(agent, 'iterative_deepening') else agent.get_move()
-                nodes_info = getattr(agent, 'nodes', 'N/A')
+            color_name = self._color_to_str(self.current_player)
+
+            if best_move is None:
+                self.append_log(f"AI {color_name} passes")
+                self._play(None, self.current_player)
             else:
-                self.append_log(f"Unknown AI interface: {self._ai_interface}")
-        except Exception as ex:
-            self.append_log(f"AI error: {ex}")
-            import traceback
-            traceback.print_exc()
+                applied = self._play(best_move, self.current_player)
+                if not applied:
+                    self.append_log(f"AI {color_name} suggested illegal move {best_move} - passing")
+                    self._play(None, self.current_player)
+                else:
+                    self.append_log(f"AI {color_name} -> {best_move} (t={elapsed:.2f}s, n={nodes_info})")
 
-        elapsed = time.time() - start_time
-        self.root.after(10, lambda: self._apply_ai_move(best_move, elapsed, nodes_info))
+            self.update_score()
 
-    def _apply_ai_move(self, best_move, elapsed, nodes_info):
-        if self.game_over or self.paused: return
-            
-        color_name = self._color_to_str(self.current_player)
-        
-        if best_move is None:
-            self.append_log(f"AI {color_name} passes")
-            self.game.make_move(None, self.current_player)
+            if self.check_game_over(): return
+
+            self.current_player = self.game.get_opponent(self.current_player)
+            self.ai_stop_event.set()
+            self.next_turn()
+        finally:
+            self._end_batch()
+
+    def _legal(self, color) -> frozenset:
+        # Legal moves of color on the current board, cached until the next move
+        key = (self._hash, color)
+        moves = self._legal_cache.get(key)
+        if moves is None:
+            moves = self._legal_cache[key] = frozenset(self.game.legal_moves(color))
+        return moves
+
+    def _play(self, move, color) -> bool:
+        # make_move plus the incremental updates of self._hash and the disc counts
+        if not self.game.make_move(move, color):
+            return False
+        self._legal_cache.clear()
+        if move is None:
+            self._hash ^= ZOBRIST_SIDE
         else:
-            applied = self.game.make_move(best_move, self.current_player)
-            if not applied:
-                self.append_log(f"AI {color_name} suggested illegal move {best_move} - passing")
-                self.game.make_move(None, self.current_player)
+            flipped = self.game.history[-1]['flipped']
+            self._hash = zobrist_update(self._hash, square_bit(*move), flipped, color)
+            n = flipped.bit_count()
+            if color == config.BLACK:
+                self._black_count += 1 + n
+                self._white_count -= n
             else:
-                self.append_log(f"AI {color_name} -> {best_move} (t={elapsed:.2f}s, n={nodes_info})")
-        
-        self.update_score()
-        
-        if self.check_game_over(): return
-        
-        self.current_player = self.game.get_opponent(self.current_player)
-        self.ai_stop_event.set()
-        self.next_turn()
+                self._white_count += 1 + n
+                self._black_count -= n
+        return True
+
+    def _new_ai_pool(self):
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, initializer=_init_ai_process, initargs=(self.ai_stop_event,))
+
+    def _submit_ai(self, fn, *args):
+        # Submit to the AI worker, starting a fresh one if it died (its
+        # agents and their tables are lost with it).
+        try:
+            return self._ai_pool.submit(fn, *args)
+        except BrokenProcessPool as ex:
+            self.append_log(f"AI worker stopped unexpectedly ({ex}); restarting it")
+            self._ai_pool.shutdown(wait=False)
+            self._ai_pool = self._new_ai_pool()
+            return self._ai_pool.submit(fn, *args)
+
+    def _close_agents(self):
+        # Queued behind any running search in the single worker
+        return self._submit_ai(_close_ai_process_agents)
 
     def update_score(self):
-        black_count = sum(row.count(config.BLACK) for row in self.game.board)
-        white_count = sum(row.count(config.WHITE) for row in self.game.board)
-        self.score_label.config(text=f"Black: {black_count}  |  White: {white_count}")
+        if self._batching:
+            self._dirty['score'] = True
+            return
+        self._render_score()
+
+    def _render_score(self):
+        self.score_label.config(text=f"Black: {self._black_count}  |  White: {self._white_count}")
 
     def check_game_over(self) -> bool:
-        if not self.game.legal_moves(config.BLACK) and not self.game.legal_moves(config.WHITE):
+        # The side about to move is the likelier one to have a move
+        if not self._legal(self.game.get_opponent(self.current_player)) and not self._legal(self.current_player):
             self.game_over = True
-            black_count = sum(row.count(config.BLACK) for row in self.game.board)
-            white_count = sum(row.count(config.WHITE) for row in self.game.board)
+            black_count, white_count = self._black_count, self._white_count
             
             winner_color = "Tie"
             if black_count > white_count: winner_color = self._color_to_str(config.BLACK)
             elif white_count > black_count: winner_color = self._color_to_str(config.WHITE)
             
             result_msg = f"GAME OVER!\n\nBlack: {black_count}\nWhite: {white_count}\n\nWinner: {winner_color}"
-            self.append_log("=" * 60)
-            self.append_log(f"GAME OVER! Winner: {winner_color}")
-            self.append_log(f"Final Score - Black: {black_count}, White: {white_count}")
-            self.append_log("=" * 60)
+            self.append_log_block([
+                "=" * 60,
+                f"GAME OVER! Winner: {winner_color}",
+                f"Final Score - Black: {black_count}, White: {white_count}",
+                "=" * 60,
+            ])
             
             self.info_label.config(text=f"GAME OVER! Winner: {winner_color}")
+            # next_turn won't run, so draw the last move here and flush it
+            # before the modal dialog
+            self.draw_board()
+            self._flush_ui()
             messagebox.showinfo("Game Over", result_msg)
             return True
         return False
@@ -456,14 +686,61 @@ class OthelloGUI:
 
     def on_quit(self):
         if messagebox.askokcancel("Quit", "Do you want to quit?"):
+            self.shutdown()
             self.root.quit()
 
+    def shutdown(self):
+        # Cancel any search, let the worker close its agents (briefly: the
+        # stop event ends a running search promptly), then release it.
+        self.ai_stop_event.set()
+        try:
+            self._close_agents().result(timeout=1.0)
+        except Exception:
+            pass  # a dead or slow worker must not hold up quitting
+        self._ai_pool.shutdown(wait=False)
+
     def append_log(self, text: str):
+        self.append_log_block((text,))
+
+    def append_log_block(self, lines):
+        # Queue several lines under one timestamp; they reach the widget
+        # in the same insert as the rest of the buffer.
         tstamp = time.strftime('%H:%M:%S')
+        self._log_buf.extend(f"[{tstamp}] {text}" for text in lines)
+        # A batch flushes the log itself in _end_batch
+        if not self._batching and not self._log_flush_pending:
+            self._log_flush_pending = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        # Write all buffered lines with a single insert and one see('end').
+        self._log_flush_pending = False
+        if not self._log_buf:
+            return
         self.move_log.config(state='normal')
-        self.move_log.insert('end', f"[{tstamp}] {text}\n")
+        self.move_log.insert('end', '\n'.join(self._log_buf) + '\n')
         self.move_log.see('end')
         self.move_log.config(state='disabled')
+        self._log_buf.clear()
+
+    def _begin_batch(self):
+        self._batching = True
+
+    def _end_batch(self):
+        self._batching = False
+        self._flush_ui()
+
+    def _flush_ui(self):
+        # Apply everything marked dirty during a batch, then let Tk redraw once.
+        dirty = self._dirty
+        self._flush_log()
+        if dirty['board']:
+            self._render_board()
+            dirty['board'] = False
+        if dirty['score']:
+            self._render_score()
+            dirty['score'] = False
+        self.root.update_idletasks()
 
 def main():
     root = tk.Tk()
@@ -2,37 +2,18 @@ import tkinter as tk
 from tkinter import messagebox
 import sys
 import os
+import importlib.util
 
 
 def check_dependencies():
     
-    missing = []
-    
-    # Check for required custom modules
-    try:
-        import gui
-    except ImportError:
-        missing.append("gui.py")
-    
-    try:
-        import game
-    except ImportError:
-        missing.append("game.py")
-    
-    try:
-        import config
-    except ImportError:
-        missing.append("config.py")
-    
-    try:
-        import utils
-    except ImportError:
-        missing.append("utils.py")
+    # Probe with find_spec so nothing is imported (and run) twice;
+    # the modules are imported once, after the check passes
+    required = ['gui', 'game', 'config', 'utils']
+    missing = [f"{m}.py" for m in required if importlib.util.find_spec(m) is None]
     
     # Check for AI module (warn but don't fail)
-    try:
-        import ai
-    except ImportError:
+    if importlib.util.find_spec('ai') is None:
         print("Warning: ai.py not found. AI player will not be available.")
     
     if missing:
@@ -47,6 +28,16 @@ def check_dependencies():
     return True
 
 
+def _center(root):
+    # Requested size is known after the idle layout pass; the real size
+    # stays 1x1 until the window is mapped.
+    window_width = root.winfo_reqwidth()
+    window_height = root.winfo_reqheight()
+    x_coordinate = (root.winfo_screenwidth() // 2) - (window_width // 2)
+    y_coordinate = (root.winfo_screenheight() // 2) - (window_height // 2)
+    root.geometry(f"+{x_coordinate}+{y_coordinate}")
+
+
 def main():
    
     try:
@@ -68,26 +59,19 @@ def main():
         except:
             pass  # Icon is optional
         
-        # Center window on screen
-        root.update_idletasks()
-        window_width = root.winfo_reqwidth()
-        window_height = root.winfo_reqheight()
-        screen_width = root.winfo_screenwidth()
-        screen_height = root.winfo_screenheight()
-        
-        x_coordinate = (screen_width // 2) - (window_width // 2)
-        y_coordinate = (screen_height // 2) - (window_height // 2)
-        root.geometry(f"+{x_coordinate}+{y_coordinate}")
-        
         # Initialize GUI app
         app = OthelloGUI(root)
         
+        # Center window on screen once Tk has laid out the widgets
+        root.after_idle(lambda: _center(root))
+        
         # Set minimum window size (prevent too small window)
         root.minsize(600, 500)
         
         # Handle window close event
         def on_closing():
             if messagebox.askokcancel("Quit", "Do you want to quit the game?"):
+                app.shutdown()
                 root.destroy()
         
         root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -0,0 +1,356 @@
+"""
+Numba-compiled bitboard alpha-beta kernel.
+
+Mirrors the pure-Python search in ai.py (move generation, move application,
+evaluation and alpha-beta) on uint64 bitboards so the whole subtree below a
+root move runs as native code. Importing this module requires numba; ai.py
+falls back to the Python search when it is not available.
+
+Boards are passed from the side to move's point of view as (own, opp),
+together with their Zobrist key and the index of the side to move
+(0 = black, 1 = white) so the key can be updated incrementally.
+Scores are always reported from the side to move's perspective (negamax),
+while the leaf evaluation itself is taken from the root player's point of
+view to stay identical to evaluate_board.
+"""
+import numpy as np
+from numba import njit, int8, int64, uint8, uint64
+from numba.types import UniTuple
+
+from config import WEIGHTS, TT_SIZE
+from game import ZOBRIST, ZOBRIST_SIDE
+
+# Large int64 sentinels used in place of math.inf
+INF = 10 ** 9
+
+# Weights are compile-time constants (numba freezes globals; clear
+# __pycache__ after editing config.WEIGHTS).
+W_MATERIAL = WEIGHTS["material"]
+W_MOBILITY = WEIGHTS["mobility"]
+W_CORNER = WEIGHTS["corner"]
+W_EDGE = WEIGHTS["edge"]
+W_STABILITY = WEIGHTS["stability"]
+
+U0 = np.uint64(0)
+U1 = np.uint64(1)
+S1 = np.uint64(1)
+S7 = np.uint64(7)
+S8 = np.uint64(8)
+S9 = np.uint64(9)
+
+NOT_A_FILE = np.uint64(0xFEFEFEFEFEFEFEFE)
+NOT_H_FILE = np.uint64(0x7F7F7F7F7F7F7F7F)
+FULL = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+CORNERS = np.uint64(0x8100000000000081)
+EDGES = np.uint64(0xFF818181818181FF)
+X_SQUARES = np.uint64(0x0042000000004200)
+QUIET = ~(CORNERS | X_SQUARES)  # neither a corner nor an X-square
+
+# Zobrist keys shared with game.py (frozen into the compiled code)
+ZOBRIST_NB = np.array(ZOBRIST, dtype=np.uint64)
+ZOBRIST_FLIP_NB = ZOBRIST_NB[:, 0] ^ ZOBRIST_NB[:, 1]
+ZOBRIST_SIDE_NB = np.uint64(ZOBRIST_SIDE)
+
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
+NO_MOVE = 64
+
+# Stability proxy: for each 4-bit pattern of owned corners (a1, h1, a8, h8)
+# the mask of those corners and their on-board neighbours
+_CORNER_NEIGHBORS = (
+    (1 << 0) | (1 << 1) | (1 << 8) | (1 << 9),
+    (1 << 7) | (1 << 6) | (1 << 14) | (1 << 15),
+    (1 << 56) | (1 << 48) | (1 << 49) | (1 << 57),
+    (1 << 63) | (1 << 54) | (1 << 55) | (1 << 62),
+)
+STABILITY_MASKS = np.array(
+    [sum(m for k, m in enumerate(_CORNER_NEIGHBORS) if pattern >> k & 1) for pattern in range(16)],
+    dtype=np.uint64,
+)
+
+
+@njit(int64(uint64), cache=True)
+def popcount_nb(x):
+    x = x - ((x >> S1) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + ((x >> np.uint64(2)) & np.uint64(0x3333333333333333))
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+    return np.int64((x * np.uint64(0x0101010101010101)) >> np.uint64(56))
+
+
+@njit(inline='always')
+def _fill_left(gen, targets, s):
+    x = targets & (gen << s)
+    x |= targets & (x << s)
+    x |= targets & (x << s)
+    x |= targets & (x << s)
+    x |= targets & (x << s)
+    x |= targets & (x << s)
+    return x
+
+
+@njit(inline='always')
+def _fill_right(gen, targets, s):
+    x = targets & (gen >> s)
+    x |= targets & (x >> s)
+    x |= targets & (x >> s)
+    x |= targets & (x >> s)
+    x |= targets & (x >> s)
+    x |= targets & (x >> s)
+    return x
+
+
+@njit(uint64(uint64, uint64), cache=True)
+def get_legal_moves_bb(own, opp):
+    empty = ~(own | opp)
+    oa = opp & NOT_A_FILE
+    oh = opp & NOT_H_FILE
+    moves = U0
+    moves |= (_fill_left(own, oa, S1) << S1) & NOT_A_FILE
+    moves |= (_fill_left(own, oh, S7) << S7) & NOT_H_FILE
+    moves |= _fill_left(own, opp, S8) << S8
+    moves |= (_fill_left(own, oa, S9) << S9) & NOT_A_FILE
+    moves |= (_fill_right(own, oh, S1) >> S1) & NOT_H_FILE
+    moves |= (_fill_right(own, oa, S7) >> S7) & NOT_A_FILE
+    moves |= _fill_right(own, opp, S8) >> S8
+    moves |= (_fill_right(own, oh, S9) >> S9) & NOT_H_FILE
+    return moves & empty
+
+
+@njit(uint64(uint64, uint64, uint64), cache=True)
+def flip_mask_bb(own, opp, move_bit):
+    oa = opp & NOT_A_FILE
+    oh = opp & NOT_H_FILE
+    flips = U0
+    x = _fill_left(move_bit, oa, S1)
+    if own & NOT_A_FILE & (x << S1):
+        flips |= x
+    x = _fill_left(move_bit, oh, S7)
+    if own & NOT_H_FILE & (x << S7):
+        flips |= x
+    x = _fill_left(move_bit, opp, S8)
+    if own & (x << S8):
+        flips |= x
+    x = _fill_left(move_bit, oa, S9)
+    if own & NOT_A_FILE & (x << S9):
+        flips |= x
+    x = _fill_right(move_bit, oh, S1)
+    if own & NOT_H_FILE & (x >> S1):
+        flips |= x
+    x = _fill_right(move_bit, oa, S7)
+    if own & NOT_A_FILE & (x >> S7):
+        flips |= x
+    x = _fill_right(move_bit, opp, S8)
+    if own & (x >> S8):
+        flips |= x
+    x = _fill_right(move_bit, oh, S9)
+    if own & NOT_H_FILE & (x >> S9):
+        flips |= x
+    return flips
+
+
+@njit(int64(uint64, uint64, uint64, uint64), cache=True)
+def evaluate_leaf_bb(own, opp, own_moves, opp_moves):
+    # Same heuristic as ai.evaluate_leaf, from own's perspective.
+    material = popcount_nb(own) - popcount_nb(opp)
+    mobility = popcount_nb(own_moves) - popcount_nb(opp_moves)
+    corners = popcount_nb(own & CORNERS) - popcount_nb(opp & CORNERS)
+    edges = popcount_nb(own & EDGES) - popcount_nb(opp & EDGES)
+
+    pattern = (own & U1) | ((own >> np.uint64(6)) & np.uint64(2)) \
+        | ((own >> np.uint64(54)) & np.uint64(4)) | ((own >> np.uint64(60)) & np.uint64(8))
+    stability = popcount_nb(own & STABILITY_MASKS[pattern])
+
+    return (W_MATERIAL * material + W_MOBILITY * mobility + W_CORNER * corners
+            + W_EDGE * edges + W_STABILITY * stability)
+
+
+@njit(int64(uint64), cache=True)
+def square_index_nb(bit):
+    return popcount_nb(bit - U1)
+
+
+@njit(uint64(uint64, uint64, uint64, int64), cache=True)
+def zobrist_update_nb(key, move_bit, flips, side):
+    key ^= ZOBRIST_SIDE_NB ^ ZOBRIST_NB[square_index_nb(move_bit), side]
+    while flips:
+        bit = flips & (~flips + U1)
+        key ^= ZOBRIST_FLIP_NB[square_index_nb(bit)]
+        flips ^= bit
+    return key
+
+
+# A table entry packs (value, depth, flag, move) into one int64 as
+# value << 16 | depth << 9 | flag << 7 | move. The key slot stores
+# key ^ data, so a half-written entry from a racing thread fails the
+# key check instead of returning a torn value (lockless hashing).
+@njit(int64(int64, int64, int64, int64), cache=True)
+def tt_pack(value, depth, flag, move):
+    return (value << 16) | (depth << 9) | (flag << 7) | move
+
+
+def new_tables(size=TT_SIZE):
+    """Allocate an empty (keys, data) transposition table of size entries."""
+    return np.zeros(size, dtype=np.uint64), np.zeros(size, dtype=np.int64)
+
+
+@njit(int64(uint64, uint64, uint64, int64, int64, int64, int64, int64,
+            uint64[:], int64[:], int64[:], int8[:]), cache=True, boundscheck=False, nogil=True)
+def alphabeta_nb(own, opp, key, side, depth, alpha, beta, sign, tt_keys, tt_data, counters, stop):
+    """
+    Negamax alpha-beta on (own, opp) = (side to move, opponent).
+
+    sign is +1 when the side to move is the root player and -1 otherwise;
+    counters[0] accumulates the number of nodes visited. Positions are
+    cached in the always-replace table tt_keys/tt_data indexed by key;
+    the table may be shared by threads, the GIL is released.
+
+    The search unwinds without storing results once stop[0] is set (the
+    flag is polled every 2048 nodes and after each child); the returned
+    score is meaningless in that case.
+    """
+    counters[0] += 1
+    if (counters[0] & 2047) == 0 and stop[0]:
+        return 0
+    moves = get_legal_moves_bb(own, opp)
+
+    # Terminal conditions: depth or no moves (evaluated for the root player,
+    # reusing the move generation above for mobility)
+    if depth == 0 or moves == U0:
+        other = get_legal_moves_bb(opp, own)
+        if sign == 1:
+            return evaluate_leaf_bb(own, opp, moves, other)
+        return -evaluate_leaf_bb(opp, own, other, moves)
+
+    # Transposition table probe
+    slot = np.int64(key & np.uint64(tt_keys.shape[0] - 1))
+    tt_move = NO_MOVE
+    data = tt_data[slot]
+    if tt_keys[slot] ^ np.uint64(data) == key:
+        tt_move = data & 127
+        if (data >> 9) & 127 >= depth:
+            tt_value = data >> 16
+            tt_flag = (data >> 7) & 3
+            if tt_flag == TT_EXACT:
+                return tt_value
+            if tt_flag == TT_LOWER and tt_value > alpha:
+                alpha = tt_value
+            elif tt_flag == TT_UPPER and tt_value < beta:
+                beta = tt_value
+            if alpha >= beta:
+                return tt_value
+
+    # Search the stored best move first, then corners, X-squares last
+    first = U0
+    if tt_move != NO_MOVE:
+        first = (U1 << np.uint64(tt_move)) & moves
+
+    alpha_orig = alpha
+    best = -INF
+    best_bit = U0
+    while moves:
+        if first:
+            move_bit = first
+            first = U0
+        elif moves & CORNERS:
+            move_bit = moves & CORNERS
+            move_bit &= ~move_bit + U1
+        elif moves & QUIET:
+            move_bit = moves & QUIET
+            move_bit &= ~move_bit + U1
+        else:
+            move_bit = moves & (~moves + U1)
+        moves ^= move_bit
+        flips = flip_mask_bb(own, opp, move_bit)
+        child_key = zobrist_update_nb(key, move_bit, flips, side)
+        value = -alphabeta_nb(opp ^ flips, own ^ (flips | move_bit), child_key, 1 - side,
+                              depth - 1, -beta, -alpha, -sign, tt_keys, tt_data, counters, stop)
+        if stop[0]:
+            return best
+        if value > best:
+            best = value
+            best_bit = move_bit
+        if value > alpha:
+            alpha = value
+        if alpha >= beta:
+            break
+
+    if best <= alpha_orig:
+        flag = TT_UPPER
+    elif best >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    data = tt_pack(best, depth, flag, square_index_nb(best_bit))
+    tt_keys[slot] = key ^ np.uint64(data)
+    tt_data[slot] = data
+    return best
+
+
+@njit(UniTuple(int64, 2)(uint64, uint64, uint64, int64, uint8[:], int64, int64, int64,
+                        uint64[:], int64[:], int64[:], int8[:]), cache=True, boundscheck=False, nogil=True)
+def root_search_nb(own, opp, key, side, moves, depth, alpha, beta, tt_keys, tt_data, counters, stop):
+    """
+    Root alpha-beta over the given moves (square indices, searched in
+    order) with (own, opp) to move as the root player.
+
+    Returns (index into moves of the best move, its fail-soft score), or
+    index -1 when stop[0] was set before any move finished.
+    """
+    best_index = -1
+    best = -INF
+    for i in range(moves.shape[0]):
+        if stop[0]:
+            break
+        move_bit = U1 << np.uint64(moves[i])
+        flips = flip_mask_bb(own, opp, move_bit)
+        child_key = zobrist_update_nb(key, move_bit, flips, side)
+        value = -alphabeta_nb(opp ^ flips, own ^ (flips | move_bit), child_key, 1 - side,
+                              depth - 1, -beta, -alpha, -1, tt_keys, tt_data, counters, stop)
+        if stop[0]:
+            break
+        if value > best:
+            best = value
+            best_index = i
+        if value > alpha:
+            alpha = value
+        if alpha >= beta:
+            break
+    return best_index, best
+
+
+def search(own, opp, key, side, depth, alpha, beta, sign, tables, counters, stop):
+    """
+    Python entry point: clamps +/-math.inf bounds to the int64 sentinels
+    and returns the negamax score of (own, opp) for the side to move.
+    tables is a (keys, data) pair from new_tables(); stop is an int8
+    array whose first element aborts the search when set.
+    """
+    alpha = max(-INF, min(INF, alpha))
+    beta = max(-INF, min(INF, beta))
+    tt_keys, tt_data = tables
+    return alphabeta_nb(own, opp, key, side, depth, int(alpha), int(beta), sign,
+                        tt_keys, tt_data, counters, stop)
+
+
+def root_search(own, opp, key, side, squares, depth, alpha, beta, tables, counters, stop):
+    """
+    Python entry point to root_search_nb: squares are the root moves as
+    row * 8 + col indices. Returns (index into squares, score); the index
+    is -1 if the search was stopped before any move was scored.
+    """
+    alpha = max(-INF, min(INF, alpha))
+    beta = max(-INF, min(INF, beta))
+    tt_keys, tt_data = tables
+    return root_search_nb(own, opp, key, side, np.asarray(squares, dtype=np.uint8), depth,
+                          int(alpha), int(beta), tt_keys, tt_data, counters, stop)
+
+
+# Warm the JIT (or load it from the on-disk cache) so the first get_move
+# isn't charged for compilation.
+search(0x0000001008000000, 0x0000000810000000, 0, 0, 1, -INF, INF, 1,
+       new_tables(2), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int8))
+root_search(0x0000001008000000, 0x0000000810000000, 0, 0, [19], 1, -INF, INF,
+            new_tables(2), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int8))
@@ -0,0 +1,86 @@
+import random
+import threading
+import unittest
+from unittest import mock
+
+import config
+import gui
+from game import OthelloGame, zobrist_hash
+
+
+class _FakeCanvas:
+    # Records item options so the drawn board can be read back without Tk.
+    def __init__(self):
+        self.items = {}
+
+    def _create(self, *args, **kw):
+        item = len(self.items) + 1
+        self.items[item] = dict(kw)
+        return item
+
+    create_rectangle = create_oval = create_text = _create
+
+    def itemconfig(self, item, **kw):
+        self.items[item].update(kw)
+
+    def coords(self, *args):
+        pass
+
+
+class _FakeWidget:
+    def __getattr__(self, name):
+        return lambda *args, **kw: None
+
+
+def _make_gui():
+    # An AI-vs-AI OthelloGUI wired to fake widgets, at the start position.
+    app = gui.OthelloGUI.__new__(gui.OthelloGUI)
+    app.root = app.info_label = app.pause_button = app.move_log = _FakeWidget()
+    app.canvas = _FakeCanvas()
+    app.game = OthelloGame()
+    app.current_player = config.BLACK
+    app.human_color = None
+    app.ai_mode = 'both'
+    app.game_over = False
+    app.paused = False
+    app._hash = zobrist_hash(app.game.board, app.current_player)
+    app._black_count, app._white_count = app.game.count_discs()
+    app._legal_cache = {}
+    app._speed_ms = 0
+    app.ai_stop_event = threading.Event()
+    app._batching = False
+    app._dirty = {'board': False, 'score': False}
+    app._log_buf = gui.collections.deque()
+    app._log_flush_pending = False
+    app.score_label = _FakeWidget()
+    app._create_board_items()
+    app.draw_board()
+    return app
+
+
+class GameOverDrawTest(unittest.TestCase):
+    def assertCanvasMatchesBoard(self, app):
+        for r in range(config.BOARD_SIZE):
+            for c in range(config.BOARD_SIZE):
+                piece = app.game.piece_at(r, c)
+                item = app.canvas.items[app.piece_items[r][c]]
+                if piece == config.EMPTY:
+                    self.assertEqual(item['state'], 'hidden', (r, c))
+                else:
+                    self.assertEqual(item['state'], 'normal', (r, c))
+                    self.assertEqual(item['fill'], 'black' if piece == config.BLACK else 'white', (r, c))
+
+    def test_final_move_drawn_before_game_over_dialog(self):
+        rng = random.Random(7)
+        for _ in range(3):
+            app = _make_gui()
+            with mock.patch.object(gui.messagebox, 'showinfo') as showinfo:
+                while not app.game_over:
+                    moves = app.game.legal_moves(app.current_player)
+                    app._apply_ai_move(rng.choice(moves) if moves else None, 0.0, 0)
+            showinfo.assert_called_once()
+            self.assertCanvasMatchesBoard(app)
+
+
+if __name__ == '__main__':
+    unittest.main()
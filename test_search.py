@@ -0,0 +1,81 @@
+import math
+import random
+import unittest
+from multiprocessing import RawValue
+from unittest import mock
+
+import ai
+import config
+from game import OthelloGame, split_board, zobrist_hash
+
+
+def _positions(count, seed=3):
+    # Seeded random mid-opening positions with at least three legal moves.
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        game, color = OthelloGame(), 1
+        for _ in range(rng.randrange(6, 16)):
+            moves = game.legal_moves(color)
+            if moves:
+                game.make_move(rng.choice(moves), color)
+            color = -color
+        if len(game.legal_moves(color)) >= 3:
+            positions.append((game, color))
+    return positions
+
+
+class ParallelWorkerTest(unittest.TestCase):
+    def test_worker_scores_match_sequential_root(self):
+        # Worker scores are from the root player's side, so the best of
+        # them must be the sequential root search's result.
+        ai._init_worker(RawValue('b', 0))
+        with mock.patch.object(ai, 'search_nb', None):
+            for game, color in _positions(4):
+                moves = game.legal_moves(color)
+                key = zobrist_hash(game.board, color)
+                results = ai._parallel_worker(
+                    (game.board, key, moves, 3, color, -math.inf, math.inf))
+                agent = ai.OthelloAI(game, color)
+                move, score = agent._root_search_sequential(game.board, moves, 3)
+                self.assertEqual(max(s for _, s in results), score)
+                self.assertEqual(dict(results)[move], score)
+
+
+@unittest.skipIf(ai.search_nb is None, "numba is not installed")
+class KernelMatchesPythonTest(unittest.TestCase):
+    # The Numba kernel must reproduce the pure-Python search exactly.
+    DEPTH = 5
+
+    def test_full_window_scores(self):
+        nb = ai.search_nb
+        for game, color in _positions(6):
+            key = zobrist_hash(game.board, color)
+            _, expected, _ = ai.negamax_search(game.board, key, self.DEPTH, -math.inf, math.inf,
+                                               color, color, {}, {}, lambda: False)
+            own, opp = split_board(game.board, color)
+            score = nb.search(own, opp, key, 0 if color == config.BLACK else 1, self.DEPTH,
+                              -math.inf, math.inf, 1, nb.new_tables(1 << 16),
+                              nb.np.zeros(1, dtype=nb.np.int64), nb.np.zeros(1, dtype=nb.np.int8))
+            self.assertEqual(score, expected)
+
+    def test_root_searches_agree(self):
+        # Sequential and YBW roots, with and without the kernel, pick the
+        # same move with the same score.
+        for game, color in _positions(6, seed=5):
+            moves = game.legal_moves(color)
+            results = []
+            for kernel in (ai.search_nb, None):
+                with mock.patch.object(ai, 'search_nb', kernel), \
+                        mock.patch.object(ai, 'cpu_count', lambda: 3):
+                    agent = ai.OthelloAI(game, color)
+                    try:
+                        results.append(agent._root_search_sequential(game.board, moves, self.DEPTH))
+                        results.append(agent._root_search_parallel(game.board, moves, self.DEPTH))
+                    finally:
+                        agent.close()
+            self.assertEqual(len(set(results)), 1, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,19 +3,16 @@ import time
 
 
 def now_seconds() -> float:
-    return time.time()
+    return time.monotonic()
 
 
 
 def format_seconds(s: float) -> str:
-    if s < 0:
-        s = 0
-        mins = int(s) // 60
-        secs = int(s) % 60
+    mins, secs = divmod(int(max(0, s)), 60)
     return f"{mins:02d}:{secs:02d}"
 
 
 
 
 def clamp(v, lo, hi):
-    return max(lo, min(hi, v))
\ No newline at end of file
+    return min(max(v, lo), hi)
\ No newline at end of file